@@ -1,6 +1,7 @@
 package com.neuralnexusstudios.nex_remote.core.feature
 
 import com.neuralnexusstudios.nex_remote.core.model.CameraInfo
+import com.neuralnexusstudios.nex_remote.core.model.JpegFrame
 import com.neuralnexusstudios.nex_remote.core.network.NexRemoteConnectionRepository
 import com.neuralnexusstudios.nex_remote.core.network.int
 import com.neuralnexusstudios.nex_remote.core.network.string
@@ -19,12 +20,12 @@ import kotlinx.serialization.json.jsonPrimitive
 class CameraRepository(private val connectionRepository: NexRemoteConnectionRepository) {
     private val scope = CoroutineScope(SupervisorJob() + Dispatchers.IO)
     private val _cameras = MutableStateFlow<List<CameraInfo>>(emptyList())
-    private val _frames = MutableStateFlow<Map<Int, ByteArray>>(emptyMap())
+    private val _frames = MutableStateFlow<Map<Int, JpegFrame>>(emptyMap())
     private val _activeCameras = MutableStateFlow<Set<Int>>(emptySet())
     private val _statusMessage = MutableStateFlow<String?>(null)
 
     val cameras: StateFlow<List<CameraInfo>> = _cameras
-    val frames: StateFlow<Map<Int, ByteArray>> = _frames
+    val frames: StateFlow<Map<Int, JpegFrame>> = _frames
     val activeCameras: StateFlow<Set<Int>> = _activeCameras
     val statusMessage: StateFlow<String?> = _statusMessage
 
@@ -83,7 +84,7 @@ class CameraRepository(private val connectionRepository: NexRemoteConnectionRepo
             connectionRepository.binaryFrames.collect { bytes ->
                 if (bytes.size > 5 && bytes[0] == 0x43.toByte() && bytes[1] == 0x41.toByte() && bytes[2] == 0x4D.toByte() && bytes[3] == 0x46.toByte()) {
                     val index = bytes[4].toInt()
-                    _frames.update { it + (index to bytes.copyOfRange(5, bytes.size)) }
+                    _frames.update { it + (index to JpegFrame(bytes, 5)) }
                 }
             }
         }
@@ -3,6 +3,7 @@ package com.neuralnexusstudios.nex_remote.core.feature
 import android.os.SystemClock
 import com.neuralnexusstudios.nex_remote.core.model.ConnectionStatus
 import com.neuralnexusstudios.nex_remote.core.model.DisplayInfo
+import com.neuralnexusstudios.nex_remote.core.model.JpegFrame
 import com.neuralnexusstudios.nex_remote.core.model.ScreenAudioFormat
 import com.neuralnexusstudios.nex_remote.core.network.NexRemoteConnectionRepository
 import com.neuralnexusstudios.nex_remote.core.network.bool
@@ -26,7 +27,7 @@ class ScreenShareRepository(private val connectionRepository: NexRemoteConnectio
     private val scope = CoroutineScope(SupervisorJob() + Dispatchers.IO)
     private val audioPlayer = ScreenAudioPlayer()
     private val _displays = MutableStateFlow<List<DisplayInfo>>(emptyList())
-    private val _frames = MutableStateFlow<Map<Int, ByteArray>>(emptyMap())
+    private val _frames = MutableStateFlow<Map<Int, JpegFrame>>(emptyMap())
     private val _activeDisplays = MutableStateFlow<List<Int>>(emptyList())
     private val _fps = MutableStateFlow(30)
     private val _quality = MutableStateFlow(70)
@@ -38,7 +39,7 @@ class ScreenShareRepository(private val connectionRepository: NexRemoteConnectio
     private var lastMoveSentAtMs = 0L
 
     val displays: StateFlow<List<DisplayInfo>> = _displays
-    val frames: StateFlow<Map<Int, ByteArray>> = _frames
+    val frames: StateFlow<Map<Int, JpegFrame>> = _frames
     val activeDisplays: StateFlow<List<Int>> = _activeDisplays
     val currentFps: StateFlow<Int> = _fps
     val currentQuality: StateFlow<Int> = _quality
@@ -101,7 +102,7 @@ class ScreenShareRepository(private val connectionRepository: NexRemoteConnectio
                 when {
                     bytes[0] == 0x53.toByte() && bytes[1] == 0x43.toByte() && bytes[2] == 0x52.toByte() && bytes[3] == 0x4E.toByte() -> {
                         val index = bytes[4].toInt()
-                        _frames.update { it + (index to bytes.copyOfRange(5, bytes.size)) }
+                        _frames.update { it + (index to JpegFrame(bytes, 5)) }
                     }
                     bytes[0] == 0x41.toByte() && bytes[1] == 0x55.toByte() && bytes[2] == 0x44.toByte() && bytes[3] == 0x46.toByte() -> {
                         if (_audioEnabled.value && _audioFormat.value != null) {
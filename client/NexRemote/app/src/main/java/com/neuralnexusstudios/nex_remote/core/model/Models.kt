@@ -44,6 +44,10 @@ data class ServerCapabilities(
     @SerialName("multi_display") val multiDisplay: Boolean = true,
 )
 
+class JpegFrame(val bytes: ByteArray, val offset: Int) {
+    val length: Int get() = bytes.size - offset
+}
+
 data class ServerSessionState(
     val serverName: String = "",
     val connected: Boolean = false,
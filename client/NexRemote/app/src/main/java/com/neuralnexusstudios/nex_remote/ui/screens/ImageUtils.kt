@@ -1,16 +1,59 @@
 package com.neuralnexusstudios.nex_remote.ui.screens
 
+import android.graphics.Bitmap
 import android.graphics.BitmapFactory
 import androidx.compose.runtime.Composable
 import androidx.compose.runtime.State
 import androidx.compose.runtime.produceState
+import androidx.compose.runtime.remember
 import androidx.compose.ui.graphics.asImageBitmap
+import com.neuralnexusstudios.nex_remote.core.model.JpegFrame
 import kotlinx.coroutines.Dispatchers
 import kotlinx.coroutines.withContext
 
 @Composable
-fun rememberJpegImage(bytes: ByteArray?): State<androidx.compose.ui.graphics.ImageBitmap?> = produceState<androidx.compose.ui.graphics.ImageBitmap?>(initialValue = null, bytes) {
-    value = withContext(Dispatchers.Default) {
-        bytes?.let { BitmapFactory.decodeByteArray(it, 0, it.size)?.asImageBitmap() }
+fun rememberJpegImage(frame: JpegFrame?): State<androidx.compose.ui.graphics.ImageBitmap?> {
+    val decoder = remember { JpegFrameDecoder() }
+    return produceState<androidx.compose.ui.graphics.ImageBitmap?>(initialValue = null, frame) {
+        val bitmap = withContext(Dispatchers.Default) {
+            frame?.let(decoder::decode)
+        }
+        value = bitmap?.asImageBitmap()
+        bitmap?.let(decoder::publish)
+    }
+}
+
+private class JpegFrameDecoder {
+    private val displayedBitmaps = ArrayDeque<Bitmap>()
+    private val reusableBitmaps = ArrayDeque<Bitmap>()
+
+    @Synchronized
+    fun decode(frame: JpegFrame): Bitmap? {
+        val options = BitmapFactory.Options().apply {
+            inMutable = true
+            inBitmap = reusableBitmaps.removeFirstOrNull()
+        }
+        return try {
+            BitmapFactory.decodeByteArray(frame.bytes, frame.offset, frame.length, options)
+        } catch (_: IllegalArgumentException) {
+            options.inBitmap = null
+            BitmapFactory.decodeByteArray(frame.bytes, frame.offset, frame.length, options)
+        }
+    }
+
+    @Synchronized
+    fun publish(bitmap: Bitmap) {
+        displayedBitmaps.addLast(bitmap)
+        if (displayedBitmaps.size > DISPLAYED_BITMAPS) {
+            val replaced = displayedBitmaps.removeFirst()
+            if (reusableBitmaps.size < REUSABLE_BITMAPS) {
+                reusableBitmaps.addLast(replaced)
+            }
+        }
+    }
+
+    private companion object {
+        const val DISPLAYED_BITMAPS = 2
+        const val REUSABLE_BITMAPS = 1
     }
 }
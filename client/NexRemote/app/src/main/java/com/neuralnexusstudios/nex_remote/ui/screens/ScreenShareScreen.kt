@@ -51,6 +51,7 @@ import androidx.compose.ui.graphics.graphicsLayer
 import androidx.compose.ui.unit.dp
 import com.neuralnexusstudios.nex_remote.core.AppContainer
 import com.neuralnexusstudios.nex_remote.core.model.DisplayInfo
+import com.neuralnexusstudios.nex_remote.core.model.JpegFrame
 import com.neuralnexusstudios.nex_remote.ui.components.AppTopBar
 
 @OptIn(ExperimentalMaterial3Api::class, ExperimentalFoundationApi::class)
@@ -277,7 +278,7 @@ fun ScreenShareScreen(
 @Composable
 private fun FullScreenSharePage(
     display: DisplayInfo,
-    frame: ByteArray?,
+    frame: JpegFrame?,
     interactive: Boolean,
     onBack: () -> Unit,
     onToggleInteractive: () -> Unit,
@@ -325,7 +326,7 @@ private fun FullScreenSharePage(
 
 @Composable
 private fun ScreenFrame(
-    frame: ByteArray,
+    frame: JpegFrame,
     interactive: Boolean,
     onOpenFullScreen: () -> Unit,
     onSendInput: (String, Float, Float, Map<String, Any?>) -> Unit,
@@ -1,4 +1,5 @@
 using System;
+using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Hosting;
@@ -15,6 +16,7 @@ public partial class App : Application
 {
     private Window? _window;
     private AppInstance? _mainInstance;
+    private static readonly TimeSpan ShutdownTimeout = TimeSpan.FromSeconds(3);
     private static int _shutdownStarted;
 
     public App()
@@ -69,11 +71,12 @@ public partial class App : Application
 
     public static async Task ShutdownAsync()
     {
-        if (System.Threading.Interlocked.Exchange(ref _shutdownStarted, 1) == 1)
+        if (Interlocked.Exchange(ref _shutdownStarted, 1) == 1)
         {
             return;
         }
 
+        using var timeout = new CancellationTokenSource(ShutdownTimeout);
         try
         {
             if (Host is not null)
@@ -81,13 +84,17 @@ public partial class App : Application
                 var coordinator = Host.Services.GetService<IServerCoordinator>();
                 if (coordinator is not null)
                 {
-                    await coordinator.StopAsync().ConfigureAwait(false);
+                    await coordinator.StopAsync(timeout.Token).WaitAsync(timeout.Token).ConfigureAwait(false);
                 }
 
-                await Host.StopAsync().ConfigureAwait(false);
+                await Host.StopAsync(timeout.Token).ConfigureAwait(false);
                 Host.Dispose();
             }
         }
+        catch (OperationCanceledException) when (timeout.IsCancellationRequested)
+        {
+            Log.Warning("Shutdown did not finish within {Timeout}; exiting anyway", ShutdownTimeout);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "Shutdown encountered an error");
@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.Diagnostics;
 using System.Globalization;
 using System.IO;
+using System.Threading;
 using NexRemote.Helpers;
 using Serilog;
 using Serilog.Events;
@@ -11,6 +12,8 @@ namespace NexRemote.Bootstrap;
 
 public static class LoggingBootstrapper
 {
+    private static int _compacted;
+
     public static void ConfigureBootstrapLogger()
     {
         var logPath = PathHelper.GetOperationalLogPath();
@@ -30,7 +33,6 @@ public static class LoggingBootstrapper
         var level = ResolveMinimumLevel();
         return (loggerConfiguration ?? new LoggerConfiguration())
             .MinimumLevel.Is(level)
-            .Enrich.FromLogContext()
             .WriteTo.File(
                 path: logPath,
                 rollingInterval: RollingInterval.Infinite,
@@ -54,6 +56,11 @@ public static class LoggingBootstrapper
 
     private static void CompactOperationalLog(string logPath, DateTimeOffset cutoff)
     {
+        if (Interlocked.Exchange(ref _compacted, 1) == 1)
+        {
+            return;
+        }
+
         try
         {
             Directory.CreateDirectory(Path.GetDirectoryName(logPath)!);
@@ -65,8 +72,10 @@ public static class LoggingBootstrapper
             var retainedEntries = new List<string>();
             var currentEntry = new List<string>();
             var keepCurrent = false;
+            var totalLines = 0;
             foreach (var line in File.ReadLines(logPath))
             {
+                totalLines++;
                 if (TryParseEntryTimestamp(line, out var timestamp))
                 {
                     if (currentEntry.Count > 0 && keepCurrent)
@@ -86,7 +95,10 @@ public static class LoggingBootstrapper
                 retainedEntries.AddRange(currentEntry);
             }
 
-            File.WriteAllLines(logPath, retainedEntries);
+            if (retainedEntries.Count < totalLines)
+            {
+                File.WriteAllLines(logPath, retainedEntries);
+            }
         }
         catch
         {
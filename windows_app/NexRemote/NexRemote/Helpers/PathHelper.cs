@@ -11,45 +11,22 @@ public static class PathHelper
     private const string AppFolderName = "NexRemote";
     private const string LegacyFolderName = "NexRemote";
 
-    public static string GetAppDataRoot()
-    {
-        try
-        {
-            return ApplicationData.Current.LocalFolder.Path;
-        }
-        catch
-        {
-            var localAppData = Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData);
-            var root = Path.Combine(localAppData, AppFolderName);
-            Directory.CreateDirectory(root);
-            return root;
-        }
-    }
+    private static readonly Lazy<string> AppDataRoot = new(ResolveAppDataRoot);
+    private static readonly Lazy<string> LogsDirectory = new(() => CreateAppDataDirectory("logs"));
+    private static readonly Lazy<string> CertificatesDirectory = new(() => CreateAppDataDirectory("certs"));
+    private static readonly Lazy<string> ToolsDirectory = new(() => CreateAppDataDirectory("tools"));
+
+    public static string GetAppDataRoot() => AppDataRoot.Value;
 
     public static string GetSettingsPath() => Path.Combine(GetAppDataRoot(), "settings.json");
 
-    public static string GetLogsDirectory()
-    {
-        var path = Path.Combine(GetAppDataRoot(), "logs");
-        Directory.CreateDirectory(path);
-        return path;
-    }
+    public static string GetLogsDirectory() => LogsDirectory.Value;
 
     public static string GetOperationalLogPath() => Path.Combine(GetLogsDirectory(), "nexremote.log");
 
-    public static string GetCertificatesDirectory()
-    {
-        var path = Path.Combine(GetAppDataRoot(), "certs");
-        Directory.CreateDirectory(path);
-        return path;
-    }
+    public static string GetCertificatesDirectory() => CertificatesDirectory.Value;
 
-    public static string GetToolsDirectory()
-    {
-        var path = Path.Combine(GetAppDataRoot(), "tools");
-        Directory.CreateDirectory(path);
-        return path;
-    }
+    public static string GetToolsDirectory() => ToolsDirectory.Value;
 
     public static string GetTrustedDevicesPath() => Path.Combine(GetAppDataRoot(), "trusted_devices.json");
 
@@ -139,6 +116,28 @@ public static class PathHelper
         }
     }
 
+    private static string ResolveAppDataRoot()
+    {
+        try
+        {
+            return ApplicationData.Current.LocalFolder.Path;
+        }
+        catch
+        {
+            var localAppData = Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData);
+            var root = Path.Combine(localAppData, AppFolderName);
+            Directory.CreateDirectory(root);
+            return root;
+        }
+    }
+
+    private static string CreateAppDataDirectory(string name)
+    {
+        var path = Path.Combine(GetAppDataRoot(), name);
+        Directory.CreateDirectory(path);
+        return path;
+    }
+
     private static void TryAddRoot(string path, ICollection<string> roots)
     {
         try
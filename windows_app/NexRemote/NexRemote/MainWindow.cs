@@ -4,6 +4,7 @@ using System.Linq;
 using System.Threading.Tasks;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.UI;
+using Microsoft.UI.Dispatching;
 using Microsoft.UI.Text;
 using Microsoft.UI.Windowing;
 using Microsoft.UI.Xaml;
@@ -25,6 +26,8 @@ public sealed partial class MainWindow : Window
     private const int MinimumWindowWidth = 800;
     private const int MinimumWindowHeight = 600;
 
+    private static readonly TimeSpan ClientRefreshInterval = TimeSpan.FromMilliseconds(100);
+
     private readonly IAppSettingsService _settingsService;
     private readonly IThemeService _themeService;
     private readonly ITrayIconService _trayIconService;
@@ -36,11 +39,20 @@ public sealed partial class MainWindow : Window
     private readonly IAdbBridgeService _adbBridgeService;
     private readonly AppWindow _appWindow;
     private readonly List<Window> _secondaryWindows = new();
+    private readonly DispatcherQueueTimer _clientRefreshTimer;
+    private readonly Style _mutedBodyTextStyle;
+    private readonly Brush _statusOkBrush;
+    private readonly Brush _statusOkForegroundBrush;
+    private readonly Brush _statusWarningBrush;
+    private readonly Brush _statusWarningForegroundBrush;
 
     private bool _allowClose;
     private bool _customTitleBarEnabled;
     private bool _initialized;
     private bool _cleanupComplete;
+    private bool _clientRefreshPending;
+    private bool _compatibilityStale = true;
+    private string[] _renderedTrustedDevices = Array.Empty<string>();
     private int _exitRequested;
 
     public MainWindow()
@@ -63,6 +75,12 @@ public sealed partial class MainWindow : Window
 
         InitializeComponent();
         Title = "NexRemote";
+        var resources = Application.Current.Resources;
+        _mutedBodyTextStyle = (Style)resources["MutedBodyTextStyle"];
+        _statusOkBrush = (Brush)resources["StatusOkBrush"];
+        _statusOkForegroundBrush = (Brush)resources["StatusOkForegroundBrush"];
+        _statusWarningBrush = (Brush)resources["StatusWarningBrush"];
+        _statusWarningForegroundBrush = (Brush)resources["StatusWarningForegroundBrush"];
         SystemBackdrop = CreateMicaAltBackdrop();
 
         ThemeBox.Items.Add(new ComboBoxItem { Content = "System" });
@@ -72,6 +90,11 @@ public sealed partial class MainWindow : Window
         FirewallProfileBox.Items.Add(new ComboBoxItem { Content = "Public only" });
         FirewallProfileBox.Items.Add(new ComboBoxItem { Content = "All profiles" });
 
+        _clientRefreshTimer = DispatcherQueue.CreateTimer();
+        _clientRefreshTimer.Interval = ClientRefreshInterval;
+        _clientRefreshTimer.IsRepeating = false;
+        _clientRefreshTimer.Tick += OnClientRefreshTimerTick;
+
         RootGrid.ActualThemeChanged += OnRootGridActualThemeChanged;
         RootGrid.Loaded += OnLoaded;
         Closed += OnClosed;
@@ -314,6 +337,10 @@ public sealed partial class MainWindow : Window
         SettingsPanelRoot.Visibility = tag == "settings" ? Visibility.Visible : Visibility.Collapsed;
         LegalPanelRoot.Visibility = tag == "legal" ? Visibility.Visible : Visibility.Collapsed;
         SupportPanelRoot.Visibility = tag == "support" ? Visibility.Visible : Visibility.Collapsed;
+        if (tag == "compatibility" && _compatibilityStale)
+        {
+            RebuildCompatibility();
+        }
 
         NavigationHeaderText.Text = tag switch
         {
@@ -450,6 +477,8 @@ public sealed partial class MainWindow : Window
         _serverCoordinator.ClientConnected -= OnRemoteServerClientConnected;
         _serverCoordinator.ClientDisconnected -= OnRemoteServerClientDisconnected;
         _approvalService.ApprovalRequested -= OnApprovalRequested;
+        _clientRefreshTimer.Stop();
+        _clientRefreshTimer.Tick -= OnClientRefreshTimerTick;
         _trayIconService.Dispose();
         foreach (var window in _secondaryWindows.ToArray())
         {
@@ -563,16 +592,46 @@ public sealed partial class MainWindow : Window
         {
             ViewModel.UpsertConnectedClient(e.ClientId, e.DeviceName, "Connected");
             ViewModel.RefreshTrustedDevices();
-            RefreshControlsFromViewModel();
+            ScheduleClientRefresh();
         });
 
     private void OnRemoteServerClientDisconnected(object? sender, ClientConnectionEventArgs e)
         => DispatcherQueue.TryEnqueue(() =>
         {
             ViewModel.RemoveConnectedClient(e.ClientId);
-            RefreshControlsFromViewModel();
+            ScheduleClientRefresh();
         });
 
+    private void ScheduleClientRefresh()
+    {
+        if (_clientRefreshTimer.IsRunning)
+        {
+            _clientRefreshPending = true;
+            return;
+        }
+
+        RefreshClientPanels();
+        _clientRefreshTimer.Start();
+    }
+
+    private void OnClientRefreshTimerTick(DispatcherQueueTimer sender, object args)
+    {
+        if (!_clientRefreshPending)
+        {
+            return;
+        }
+
+        _clientRefreshPending = false;
+        RefreshClientPanels();
+        _clientRefreshTimer.Start();
+    }
+
+    private void RefreshClientPanels()
+    {
+        RebuildClients();
+        RebuildTrustedDevices();
+    }
+
     private void ApplyControlValuesToViewModel()
     {
         ViewModel.PcName = PcNameBox.Text;
@@ -617,7 +676,14 @@ public sealed partial class MainWindow : Window
         QrPlaceholderText.Visibility = ViewModel.QrCodeImage is null ? Visibility.Visible : Visibility.Collapsed;
         RebuildClients();
         RebuildTrustedDevices();
-        RebuildCompatibility();
+        if (CompatibilityPanelRoot.Visibility == Visibility.Visible)
+        {
+            RebuildCompatibility();
+        }
+        else
+        {
+            _compatibilityStale = true;
+        }
     }
 
     private void RebuildClients()
@@ -637,6 +703,13 @@ public sealed partial class MainWindow : Window
 
     private void RebuildTrustedDevices()
     {
+        var rows = ViewModel.TrustedDevices.Select(device => device.ToString()).ToArray();
+        if (TrustedDevicesPanel.Children.Count > 0 && rows.SequenceEqual(_renderedTrustedDevices, StringComparer.Ordinal))
+        {
+            return;
+        }
+
+        _renderedTrustedDevices = rows;
         TrustedDevicesPanel.Children.Clear();
         if (ViewModel.TrustedDevices.Count == 0)
         {
@@ -652,19 +725,23 @@ public sealed partial class MainWindow : Window
 
     private void RebuildCompatibility()
     {
-        CompatibilityStatusPanel.Children.Clear();
+        _compatibilityStale = false;
+        var panel = CompatibilityStatusPanel.Children;
+        panel.Clear();
+        var settings = _settingsService.Current;
         var adbStatus = _adbBridgeService.CurrentStatus;
         var gamepadDriverInstalled = _gamepadDriverService.IsViGEmBusInstalled();
         var gamepadBackendReady = gamepadDriverInstalled && _gamepadTransportService.IsReady;
-
-        CompatibilityStatusPanel.Children.Add(CreateCompatibilityRow("Server Running", ViewModel.IsServerRunning, ViewModel.ServerStatusText));
-        CompatibilityStatusPanel.Children.Add(CreateCompatibilityRow("Certificate Ready", !string.IsNullOrWhiteSpace(_settingsService.Current.CertificateFingerprint), string.IsNullOrWhiteSpace(_settingsService.Current.CertificateFingerprint) ? "The secure certificate is still missing." : "Secure certificate fingerprint is available for pairing."));
-        CompatibilityStatusPanel.Children.Add(CreateCompatibilityRow("Remote Access Consent", _settingsService.Current.RemoteControlConsentGranted && _settingsService.Current.EnableRemoteAccess, _settingsService.Current.RemoteControlConsentGranted ? "LAN access is approved." : "LAN access still requires local approval."));
-        CompatibilityStatusPanel.Children.Add(CreateCompatibilityRow("Camera Permission", _settingsService.Current.CameraAccessConsentGranted, _settingsService.Current.CameraAccessConsentGranted ? "Camera streaming permission is granted." : "Camera streaming needs local consent."));
-        CompatibilityStatusPanel.Children.Add(CreateCompatibilityRow("ViGEmBus", gamepadDriverInstalled, gamepadDriverInstalled ? "Virtual gamepad driver detected." : "Install ViGEmBus to enable native controller transport."));
-        CompatibilityStatusPanel.Children.Add(CreateCompatibilityRow("Gamepad Backend", gamepadBackendReady, ViewModel.GamepadSupportText));
-        CompatibilityStatusPanel.Children.Add(CreateCompatibilityRow("ADB Bridge", adbStatus.ToolAvailable, adbStatus.Reason));
-        CompatibilityStatusPanel.Children.Add(CreateCompatibilityRow("ADB Reverse", adbStatus.ReverseActive, adbStatus.Reason));
+        var certificateReady = !string.IsNullOrWhiteSpace(settings.CertificateFingerprint);
+
+        panel.Add(CreateCompatibilityRow("Server Running", ViewModel.IsServerRunning, ViewModel.ServerStatusText));
+        panel.Add(CreateCompatibilityRow("Certificate Ready", certificateReady, certificateReady ? "Secure certificate fingerprint is available for pairing." : "The secure certificate is still missing."));
+        panel.Add(CreateCompatibilityRow("Remote Access Consent", settings.RemoteControlConsentGranted && settings.EnableRemoteAccess, settings.RemoteControlConsentGranted ? "LAN access is approved." : "LAN access still requires local approval."));
+        panel.Add(CreateCompatibilityRow("Camera Permission", settings.CameraAccessConsentGranted, settings.CameraAccessConsentGranted ? "Camera streaming permission is granted." : "Camera streaming needs local consent."));
+        panel.Add(CreateCompatibilityRow("ViGEmBus", gamepadDriverInstalled, gamepadDriverInstalled ? "Virtual gamepad driver detected." : "Install ViGEmBus to enable native controller transport."));
+        panel.Add(CreateCompatibilityRow("Gamepad Backend", gamepadBackendReady, ViewModel.GamepadSupportText));
+        panel.Add(CreateCompatibilityRow("ADB Bridge", adbStatus.ToolAvailable, adbStatus.Reason));
+        panel.Add(CreateCompatibilityRow("ADB Reverse", adbStatus.ReverseActive, adbStatus.Reason));
         CompatibilityViGemGuideButton.Visibility = gamepadBackendReady ? Visibility.Collapsed : Visibility.Visible;
     }
 
@@ -707,7 +784,7 @@ public sealed partial class MainWindow : Window
         return button;
     }
 
-    private static FrameworkElement CreateActionRow(string title, string subtitle, string actionText, string tag, RoutedEventHandler handler)
+    private FrameworkElement CreateActionRow(string title, string subtitle, string actionText, string tag, RoutedEventHandler handler)
     {
         var grid = new Grid { ColumnSpacing = 12 };
         grid.ColumnDefinitions.Add(new ColumnDefinition { Width = new GridLength(1, GridUnitType.Star) });
@@ -718,7 +795,7 @@ public sealed partial class MainWindow : Window
             Children =
             {
                 new TextBlock { Text = title, FontWeight = FontWeights.SemiBold },
-                new TextBlock { Text = subtitle, Style = (Style)Application.Current.Resources["MutedBodyTextStyle"], TextWrapping = TextWrapping.WrapWholeWords }
+                new TextBlock { Text = subtitle, Style = _mutedBodyTextStyle, TextWrapping = TextWrapping.WrapWholeWords }
             }
         });
         var button = new Button { Content = actionText, Tag = tag, VerticalAlignment = VerticalAlignment.Center };
@@ -734,7 +811,7 @@ public sealed partial class MainWindow : Window
         };
     }
 
-    private static FrameworkElement CreateCompatibilityRow(string title, bool ready, string message)
+    private FrameworkElement CreateCompatibilityRow(string title, bool ready, string message)
     {
         var grid = new Grid { ColumnSpacing = 12 };
         grid.ColumnDefinitions.Add(new ColumnDefinition { Width = GridLength.Auto });
@@ -746,7 +823,7 @@ public sealed partial class MainWindow : Window
             FontSize = 18,
             FontWeight = FontWeights.Bold,
             VerticalAlignment = VerticalAlignment.Top,
-            Foreground = (Brush)Application.Current.Resources[ready ? "StatusOkForegroundBrush" : "StatusWarningForegroundBrush"]
+            Foreground = ready ? _statusOkForegroundBrush : _statusWarningForegroundBrush
         };
         grid.Children.Add(icon);
 
@@ -756,7 +833,7 @@ public sealed partial class MainWindow : Window
             Children =
             {
                 new TextBlock { Text = title, FontWeight = FontWeights.SemiBold },
-                new TextBlock { Text = message, Style = (Style)Application.Current.Resources["MutedBodyTextStyle"], TextWrapping = TextWrapping.WrapWholeWords }
+                new TextBlock { Text = message, Style = _mutedBodyTextStyle, TextWrapping = TextWrapping.WrapWholeWords }
             }
         };
         Grid.SetColumn(content, 1);
@@ -766,12 +843,12 @@ public sealed partial class MainWindow : Window
         {
             Padding = new Thickness(14),
             CornerRadius = new CornerRadius(16),
-            Background = (Brush)Application.Current.Resources[ready ? "StatusOkBrush" : "StatusWarningBrush"],
+            Background = ready ? _statusOkBrush : _statusWarningBrush,
             Child = grid
         };
     }
 
-    private static FrameworkElement EmptyState(string text)
+    private FrameworkElement EmptyState(string text)
         => new Border
         {
             Padding = new Thickness(14),
@@ -780,7 +857,7 @@ public sealed partial class MainWindow : Window
             Child = new TextBlock
             {
                 Text = text,
-                Style = (Style)Application.Current.Resources["MutedBodyTextStyle"],
+                Style = _mutedBodyTextStyle,
                 TextWrapping = TextWrapping.WrapWholeWords
             }
         };
@@ -0,0 +1,12 @@
+using System.Text.Json.Serialization;
+using NexRemote.Models;
+
+namespace NexRemote.Services;
+
+[JsonSourceGenerationOptions(
+    PropertyNameCaseInsensitive = true,
+    DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull)]
+[JsonSerializable(typeof(AppSettings))]
+internal sealed partial class AppSettingsJsonContext : JsonSerializerContext
+{
+}
@@ -20,6 +20,8 @@ public sealed class AppSettingsService : IAppSettingsService
 {
     private readonly string _filePath = PathHelper.GetSettingsPath();
     private readonly SemaphoreSlim _gate = new(1, 1);
+    private string? _persistedJson;
+    private bool _directoryReady;
 
     public AppSettings Current { get; private set; } = AppSettings.CreateDefault();
 
@@ -64,7 +66,8 @@ public sealed class AppSettingsService : IAppSettingsService
         if (File.Exists(_filePath))
         {
             var json = await File.ReadAllTextAsync(_filePath, cancellationToken).ConfigureAwait(false);
-            var loaded = JsonSerializer.Deserialize<AppSettings>(json, ProtocolJson.SharedOptions);
+            _persistedJson = json;
+            var loaded = JsonSerializer.Deserialize(json, AppSettingsJsonContext.Default.AppSettings);
             if (loaded is not null)
             {
                 Normalize(loaded);
@@ -79,9 +82,20 @@ public sealed class AppSettingsService : IAppSettingsService
 
     private async Task SaveCoreAsync(CancellationToken cancellationToken)
     {
-        Directory.CreateDirectory(Path.GetDirectoryName(_filePath)!);
-        var json = JsonSerializer.Serialize(Current, ProtocolJson.SharedOptions);
+        var json = JsonSerializer.Serialize(Current, AppSettingsJsonContext.Default.AppSettings);
+        if (string.Equals(json, _persistedJson, StringComparison.Ordinal))
+        {
+            return;
+        }
+
+        if (!_directoryReady)
+        {
+            Directory.CreateDirectory(Path.GetDirectoryName(_filePath)!);
+            _directoryReady = true;
+        }
+
         await File.WriteAllTextAsync(_filePath, json, cancellationToken).ConfigureAwait(false);
+        _persistedJson = json;
     }
 
     private static void Normalize(AppSettings settings)
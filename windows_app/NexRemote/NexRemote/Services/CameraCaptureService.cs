@@ -1,11 +1,13 @@
 using System;
 using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
 using System.Runtime.InteropServices.WindowsRuntime;
 using System.Threading;
 using System.Threading.Tasks;
 using Windows.Devices.Enumeration;
+using Windows.Foundation;
 using Windows.Graphics.Imaging;
 using Windows.Media.Capture;
 using Windows.Media.Capture.Frames;
@@ -30,10 +32,12 @@ internal sealed record CameraDescriptor(int Index, string Id, string Name, Media
 internal sealed class CameraCaptureService
 {
     private static readonly TimeSpan FirstFrameTimeout = TimeSpan.FromSeconds(4);
+    private static readonly TimeSpan CameraCacheFreshness = TimeSpan.FromSeconds(5);
     private readonly ConcurrentDictionary<string, bool> _activeCameraIds = new(StringComparer.OrdinalIgnoreCase);
     private readonly ConcurrentDictionary<string, CameraSession> _sessions = new(StringComparer.OrdinalIgnoreCase);
     private readonly SemaphoreSlim _deviceGate = new(1, 1);
     private IReadOnlyList<CameraDescriptor> _cameraCache = Array.Empty<CameraDescriptor>();
+    private DateTimeOffset _cameraCacheAt = DateTimeOffset.MinValue;
 
     public async Task<IReadOnlyList<object>> GetCamerasAsync()
     {
@@ -166,7 +170,7 @@ internal sealed class CameraCaptureService
             session = await GetOrCreateSessionAsync(descriptor, cancellationToken).ConfigureAwait(false);
         }
 
-        return session?.GetLatestFrame() ?? Array.Empty<byte>();
+        return session is null ? Array.Empty<byte>() : await session.GetLatestFrameAsync().ConfigureAwait(false);
     }
 
     public CameraErrorInfo? GetLastError(int cameraIndex)
@@ -188,21 +192,19 @@ internal sealed class CameraCaptureService
         await _deviceGate.WaitAsync().ConfigureAwait(false);
         try
         {
-            var devices = await DeviceInformation.FindAllAsync(DeviceClass.VideoCapture);
-            IReadOnlyList<MediaFrameSourceGroup> groups;
-            try
+            if (_cameraCache.Count > 0 && DateTimeOffset.UtcNow - _cameraCacheAt < CameraCacheFreshness)
             {
-                groups = await MediaFrameSourceGroup.FindAllAsync();
-            }
-            catch (Exception ex)
-            {
-                Log.Warning(ex, "Failed to enumerate media frame source groups for cameras.");
-                groups = Array.Empty<MediaFrameSourceGroup>();
+                return _cameraCache;
             }
 
+            var groupsTask = FindSourceGroupsAsync();
+            var devices = await DeviceInformation.FindAllAsync(DeviceClass.VideoCapture);
+            var groups = await groupsTask.ConfigureAwait(false);
+
             _cameraCache = devices
                 .Select((device, index) => new CameraDescriptor(index, device.Id, device.Name, FindSourceGroup(groups, device.Id)))
                 .ToList();
+            _cameraCacheAt = DateTimeOffset.UtcNow;
 
             return _cameraCache;
         }
@@ -218,6 +220,19 @@ internal sealed class CameraCaptureService
         }
     }
 
+    private static async Task<IReadOnlyList<MediaFrameSourceGroup>> FindSourceGroupsAsync()
+    {
+        try
+        {
+            return await MediaFrameSourceGroup.FindAllAsync();
+        }
+        catch (Exception ex)
+        {
+            Log.Warning(ex, "Failed to enumerate media frame source groups for cameras.");
+            return Array.Empty<MediaFrameSourceGroup>();
+        }
+    }
+
     private async Task<CameraSession> GetOrCreateSessionAsync(CameraDescriptor descriptor, CancellationToken cancellationToken)
     {
         if (_sessions.TryGetValue(descriptor.Id, out var existing))
@@ -343,13 +358,18 @@ internal sealed class CameraCaptureService
 
     private sealed class CameraSession : IAsyncDisposable
     {
-        private readonly object _frameGate = new();
+        private const float JpegQuality = 0.75f;
+        private const byte JpegSubsampling420 = 1;
+        private static readonly TimeSpan ConsumerIdleTimeout = TimeSpan.FromSeconds(2);
         private readonly TaskCompletionSource<bool> _firstFrameReceived = new(TaskCreationOptions.RunContinuationsAsynchronously);
         private readonly CameraDescriptor _descriptor;
-        private byte[] _latestFrame = Array.Empty<byte>();
-        private DateTimeOffset _lastFrameAt = DateTimeOffset.MinValue;
-        private CameraErrorInfo? _lastError;
-        private bool _disposed;
+        private readonly BitmapPropertySet _jpegOptions = CreateJpegEncodingOptions();
+        private readonly InMemoryRandomAccessStream _encodeStream = new();
+        private FrameState _state = FrameState.Empty;
+        private readonly object _encodeSync = new();
+        private long _lastReadAt = Stopwatch.GetTimestamp();
+        private Task _encodeTask = Task.CompletedTask;
+        private volatile bool _disposed;
 
         public CameraSession(CameraDescriptor descriptor, MediaCapture capture, MediaFrameReader reader)
         {
@@ -379,40 +399,37 @@ internal sealed class CameraCaptureService
             }
         }
 
-        public byte[] GetLatestFrame()
+        public async Task<byte[]> GetLatestFrameAsync()
         {
-            lock (_frameGate)
+            var previousReadAt = Interlocked.Exchange(ref _lastReadAt, Stopwatch.GetTimestamp());
+            if (Stopwatch.GetElapsedTime(previousReadAt) > ConsumerIdleTimeout)
             {
-                if (_lastError is not null)
-                {
-                    return Array.Empty<byte>();
-                }
+                await StartEncode().ConfigureAwait(false);
+            }
 
-                if (_latestFrame.Length == 0)
-                {
-                    return Array.Empty<byte>();
-                }
+            var state = Volatile.Read(ref _state);
+            if (state.Error is not null || state.Frame.Length == 0)
+            {
+                return Array.Empty<byte>();
+            }
 
-                if (DateTimeOffset.UtcNow - _lastFrameAt > TimeSpan.FromSeconds(5))
+            if (DateTimeOffset.UtcNow - state.ReceivedAt > TimeSpan.FromSeconds(5))
+            {
+                var stalled = state with
                 {
-                    _lastError = new CameraErrorInfo(
+                    Error = new CameraErrorInfo(
                         "frame_timeout",
-                        $"{_descriptor.Name} stopped producing video frames.");
-                    return Array.Empty<byte>();
-                }
-
-                return _latestFrame;
+                        $"{_descriptor.Name} stopped producing video frames.")
+                };
+                Interlocked.CompareExchange(ref _state, stalled, state);
+                return Array.Empty<byte>();
             }
-        }
 
-        public CameraErrorInfo? GetLastError()
-        {
-            lock (_frameGate)
-            {
-                return _lastError;
-            }
+            return state.Frame;
         }
 
+        public CameraErrorInfo? GetLastError() => Volatile.Read(ref _state).Error;
+
         public void OnFrameArrived(MediaFrameReader sender, MediaFrameArrivedEventArgs args)
         {
             if (_disposed)
@@ -420,37 +437,15 @@ internal sealed class CameraCaptureService
                 return;
             }
 
-            try
+            var state = Volatile.Read(ref _state);
+            if (state.Frame.Length > 0 &&
+                state.Error is null &&
+                Stopwatch.GetElapsedTime(Volatile.Read(ref _lastReadAt)) > ConsumerIdleTimeout)
             {
-                using var frameReference = sender.TryAcquireLatestFrame();
-                var softwareBitmap = frameReference?.VideoMediaFrame?.SoftwareBitmap;
-                if (softwareBitmap is null)
-                {
-                    return;
-                }
-
-                var encoded = EncodeFrame(softwareBitmap);
-                if (encoded.Length == 0)
-                {
-                    return;
-                }
-
-                lock (_frameGate)
-                {
-                    _latestFrame = encoded;
-                    _lastFrameAt = DateTimeOffset.UtcNow;
-                    _lastError = null;
-                }
-
-                _firstFrameReceived.TrySetResult(true);
-            }
-            catch (Exception ex)
-            {
-                Log.Warning(ex, "Camera frame encoding failed for {CameraName}.", _descriptor.Name);
-                SetError(
-                    "frame_encode_failed",
-                    $"{_descriptor.Name} produced a frame that NexRemote could not encode for streaming.");
+                return;
             }
+
+            _ = StartEncode();
         }
 
         public void OnCaptureFailed(MediaCapture sender, MediaCaptureFailedEventArgs errorEventArgs)
@@ -481,37 +476,117 @@ internal sealed class CameraCaptureService
                 // ignored
             }
 
+            Task pendingEncode;
+            lock (_encodeSync)
+            {
+                pendingEncode = _encodeTask;
+            }
+
+            await pendingEncode.ConfigureAwait(false);
+
             Reader.Dispose();
             Capture.Dispose();
+            _encodeStream.Dispose();
+        }
+
+        private Task StartEncode()
+        {
+            TaskCompletionSource completion;
+            lock (_encodeSync)
+            {
+                if (_disposed || !_encodeTask.IsCompleted)
+                {
+                    return _encodeTask;
+                }
+
+                completion = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+                _encodeTask = completion.Task;
+            }
+
+            _ = EncodeLatestFrameAsync(Reader, completion);
+            return completion.Task;
+        }
+
+        private async Task EncodeLatestFrameAsync(MediaFrameReader reader, TaskCompletionSource completion)
+        {
+            try
+            {
+                if (_disposed)
+                {
+                    return;
+                }
+
+                using var frameReference = reader.TryAcquireLatestFrame();
+                var softwareBitmap = frameReference?.VideoMediaFrame?.SoftwareBitmap;
+                if (softwareBitmap is null)
+                {
+                    return;
+                }
+
+                var encoded = await EncodeFrameAsync(softwareBitmap).ConfigureAwait(false);
+                if (encoded.Length == 0)
+                {
+                    return;
+                }
+
+                Volatile.Write(ref _state, new FrameState(encoded, DateTimeOffset.UtcNow, null));
+                _firstFrameReceived.TrySetResult(true);
+            }
+            catch (Exception ex)
+            {
+                Log.Warning(ex, "Camera frame encoding failed for {CameraName}.", _descriptor.Name);
+                SetError(
+                    "frame_encode_failed",
+                    $"{_descriptor.Name} produced a frame that NexRemote could not encode for streaming.");
+            }
+            finally
+            {
+                completion.TrySetResult();
+            }
         }
 
         private void SetError(string code, string message)
         {
-            lock (_frameGate)
+            var error = new CameraErrorInfo(code, message);
+            FrameState current;
+            do
             {
-                _lastError = new CameraErrorInfo(code, message);
+                current = Volatile.Read(ref _state);
             }
+            while (Interlocked.CompareExchange(ref _state, current with { Error = error }, current) != current);
 
             _firstFrameReceived.TrySetResult(false);
         }
 
-        private static byte[] EncodeFrame(SoftwareBitmap softwareBitmap)
+        private async Task<byte[]> EncodeFrameAsync(SoftwareBitmap softwareBitmap)
         {
-            using var converted = SoftwareBitmap.Convert(
-                softwareBitmap,
-                BitmapPixelFormat.Bgra8,
-                BitmapAlphaMode.Ignore);
-            using var stream = new InMemoryRandomAccessStream();
-            var encoder = BitmapEncoder.CreateAsync(BitmapEncoder.JpegEncoderId, stream).AsTask().GetAwaiter().GetResult();
-            encoder.SetSoftwareBitmap(converted);
+            using var converted = softwareBitmap.BitmapPixelFormat == BitmapPixelFormat.Bgra8
+                ? null
+                : SoftwareBitmap.Convert(softwareBitmap, BitmapPixelFormat.Bgra8, BitmapAlphaMode.Ignore);
+            var stream = _encodeStream;
+            stream.Size = 0;
+            stream.Seek(0);
+            var encoder = await BitmapEncoder.CreateAsync(BitmapEncoder.JpegEncoderId, stream, _jpegOptions).AsTask().ConfigureAwait(false);
+            encoder.SetSoftwareBitmap(converted ?? softwareBitmap);
             encoder.IsThumbnailGenerated = false;
-            encoder.FlushAsync().AsTask().GetAwaiter().GetResult();
+            await encoder.FlushAsync().AsTask().ConfigureAwait(false);
             stream.Seek(0);
             var size = checked((int)stream.Size);
             var bytes = new byte[size];
-            stream.ReadAsync(bytes.AsBuffer(), (uint)size, InputStreamOptions.None).AsTask().GetAwaiter().GetResult();
+            await stream.ReadAsync(bytes.AsBuffer(), (uint)size, InputStreamOptions.None).AsTask().ConfigureAwait(false);
             return bytes;
         }
+
+        private static BitmapPropertySet CreateJpegEncodingOptions() => new()
+        {
+            { "ImageQuality", new BitmapTypedValue(JpegQuality, PropertyType.Single) },
+            { "JpegYCrCbSubsampling", new BitmapTypedValue(JpegSubsampling420, PropertyType.UInt8) }
+        };
+
+        private sealed record FrameState(byte[] Frame, DateTimeOffset ReceivedAt, CameraErrorInfo? Error)
+        {
+            public static FrameState Empty { get; } = new(Array.Empty<byte>(), DateTimeOffset.MinValue, null);
+        }
     }
 
     private sealed class CameraServiceException : Exception
@@ -1,18 +1,57 @@
 using System;
+using System.Buffers;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.Globalization;
 using System.IO;
+using System.IO.Enumeration;
 using System.Linq;
+using System.Text;
 using System.Text.Json;
 using System.Text.Json.Serialization;
+using System.Threading;
 using System.Threading.Tasks;
+using Microsoft.Win32.SafeHandles;
 
 namespace NexRemote.Services;
 
 internal sealed class FileExplorerService
 {
+    private const int MaxSearchDepth = 8;
+    private const int MaxSearchResults = 1000;
+    private const string ModifiedFormat = "yyyy-MM-dd HH:mm";
+    private const string TimestampFormat = "yyyy-MM-dd HH:mm:ss";
+
+    private static readonly EnumerationOptions ListingOptions = new()
+    {
+        AttributesToSkip = 0,
+        IgnoreInaccessible = false,
+        BufferSize = 64 * 1024
+    };
+
+    private static readonly EnumerationOptions SubdirectoryOptions = new()
+    {
+        AttributesToSkip = FileAttributes.ReparsePoint,
+        BufferSize = 64 * 1024
+    };
+
+    private static readonly ParallelOptions SearchParallelism = new()
+    {
+        MaxDegreeOfParallelism = Math.Clamp(Environment.ProcessorCount, 2, 8)
+    };
+
+    private static readonly HashSet<string> LongRunningActions = new(StringComparer.Ordinal) { "delete", "copy", "move" };
+    private static readonly TimeSpan DriveRootsFreshness = TimeSpan.FromSeconds(5);
+
     private readonly long _maxReadSize = 5L * 1024 * 1024;
+    private volatile DriveRoots? _driveRoots;
+
+    public static bool IsLongRunning(JsonElement data)
+    {
+        var action = GetString(data, "action");
+        return LongRunningActions.Contains(action) || (action == "search" && GetInt32(data, "depth") > 0);
+    }
 
     public Task<object> HandleRequestAsync(JsonElement data)
     {
@@ -22,10 +61,10 @@ internal sealed class FileExplorerService
             object response = action switch
             {
                 "drive_list" => ListDrives(),
-                "list" => ListDirectory(GetString(data, "path", @"C:\")),
+                "list" => ListDirectory(GetString(data, "path", @"C:\"), GetInt32(data, "offset"), GetInt32(data, "limit"), GetString(data, "layout"), GetString(data, "mode")),
                 "open" => OpenPath(GetString(data, "path")),
                 "properties" => GetProperties(GetString(data, "path")),
-                "search" => Search(GetString(data, "path", @"C:\"), GetString(data, "query")),
+                "search" => Search(GetString(data, "path", @"C:\"), GetString(data, "query"), GetInt32(data, "limit"), GetInt32(data, "depth")),
                 "copy_path" => new { type = "file_explorer", action = "path_copied", path = GetString(data, "path") },
                 "create_folder" => CreateFolder(GetString(data, "path"), GetString(data, "name")),
                 "create_file" => CreateFile(GetString(data, "path"), GetString(data, "name"), GetString(data, "content")),
@@ -75,7 +114,7 @@ internal sealed class FileExplorerService
         }
     }
 
-    private object ListDirectory(string path)
+    private object ListDirectory(string path, int offset, int limit, string layout, string mode)
     {
         if (!ValidatePath(path))
         {
@@ -84,42 +123,30 @@ internal sealed class FileExplorerService
 
         try
         {
-            var items = new List<FileItem>();
-            foreach (var entry in Directory.EnumerateFileSystemEntries(path))
+            if (string.Equals(mode, "names", StringComparison.Ordinal))
             {
-                try
-                {
-                    var fileInfo = new FileInfo(entry);
-                    var directoryInfo = new DirectoryInfo(entry);
-                    var isDirectory = directoryInfo.Exists;
-                    var stat = (FileSystemInfo)(isDirectory ? directoryInfo : fileInfo);
-
-                    items.Add(new FileItem
-                    {
-                        Name = Path.GetFileName(entry),
-                        FilePath = entry,
-                        IsDirectory = isDirectory,
-                        Size = isDirectory ? null : fileInfo.Length,
-                        Modified = stat.LastWriteTime.ToString("yyyy-MM-dd HH:mm", CultureInfo.InvariantCulture)
-                    });
-                }
-                catch
-                {
-                    // Skip inaccessible entries.
-                }
+                var names = ReadNames(path);
+                return new { type = "file_explorer", action = "list", mode = "names", path, names, total = names.Count };
             }
 
-            var ordered = items
-                .OrderBy(item => !item.IsDirectory)
-                .ThenBy(item => item.Name.ToLowerInvariant())
-                .ToList();
+            var items = ReadItems(path, null);
+
+            offset = Math.Max(0, offset);
+            var files = SortPage(items, offset, limit);
+
+            if (string.Equals(layout, "columns", StringComparison.Ordinal))
+            {
+                return CreateColumnListing(path, files, limit > 0 ? offset : 0, items.Count);
+            }
 
             return new
             {
                 type = "file_explorer",
                 action = "list",
                 path,
-                files = ordered
+                files,
+                offset = limit > 0 ? offset : 0,
+                total = items.Count
             };
         }
         catch (Exception ex)
@@ -128,6 +155,36 @@ internal sealed class FileExplorerService
         }
     }
 
+    private static object CreateColumnListing(string path, List<FileItem> files, int offset, int total)
+    {
+        var names = new string[files.Count];
+        var isDirectory = new bool[files.Count];
+        var sizes = new long?[files.Count];
+        var modified = new string[files.Count];
+        for (var i = 0; i < files.Count; i++)
+        {
+            var item = files[i];
+            names[i] = item.Name;
+            isDirectory[i] = item.IsDirectory;
+            sizes[i] = item.Size;
+            modified[i] = item.Modified;
+        }
+
+        return new
+        {
+            type = "file_explorer",
+            action = "list",
+            layout = "columns",
+            path,
+            names,
+            is_directory = isDirectory,
+            sizes,
+            modified,
+            offset,
+            total
+        };
+    }
+
     private object OpenPath(string path)
     {
         if (!ValidatePath(path))
@@ -137,19 +194,14 @@ internal sealed class FileExplorerService
 
         try
         {
-            if (File.Exists(path))
-            {
-                Process.Start(new ProcessStartInfo(path) { UseShellExecute = true });
-                return new { type = "file_explorer", action = "file_opened", path };
-            }
-
-            if (Directory.Exists(path))
+            var isFile = File.Exists(path);
+            if (!isFile && !Directory.Exists(path))
             {
-                Process.Start(new ProcessStartInfo("explorer.exe", $"\"{path}\"") { UseShellExecute = true });
-                return new { type = "file_explorer", action = "folder_opened", path };
+                return Error("File or folder not found");
             }
 
-            return Error("File or folder not found");
+            Process.Start(new ProcessStartInfo(path) { UseShellExecute = true })?.Dispose();
+            return new { type = "file_explorer", action = isFile ? "file_opened" : "folder_opened", path };
         }
         catch (Exception ex)
         {
@@ -185,9 +237,9 @@ internal sealed class FileExplorerService
                 item_type = isDirectory ? "directory" : "file",
                 is_directory = isDirectory,
                 size = isDirectory ? 0L : fileInfo.Length,
-                created = stat.CreationTime.ToString("yyyy-MM-dd HH:mm:ss", CultureInfo.InvariantCulture),
-                modified = stat.LastWriteTime.ToString("yyyy-MM-dd HH:mm:ss", CultureInfo.InvariantCulture),
-                accessed = stat.LastAccessTime.ToString("yyyy-MM-dd HH:mm:ss", CultureInfo.InvariantCulture)
+                created = stat.CreationTime.ToString(TimestampFormat, CultureInfo.InvariantCulture),
+                modified = stat.LastWriteTime.ToString(TimestampFormat, CultureInfo.InvariantCulture),
+                accessed = stat.LastAccessTime.ToString(TimestampFormat, CultureInfo.InvariantCulture)
             };
         }
         catch (Exception ex)
@@ -196,7 +248,7 @@ internal sealed class FileExplorerService
         }
     }
 
-    private object Search(string path, string query)
+    private object Search(string path, string query, int limit, int depth)
     {
         if (!ValidatePath(path))
         {
@@ -205,45 +257,11 @@ internal sealed class FileExplorerService
 
         try
         {
-            var items = new List<object>();
-            var needle = query.ToLowerInvariant();
-
-            foreach (var entry in Directory.EnumerateFileSystemEntries(path))
-            {
-                try
-                {
-                    var name = Path.GetFileName(entry);
-                    if (!name.ToLowerInvariant().Contains(needle))
-                    {
-                        continue;
-                    }
-
-                    var fileInfo = new FileInfo(entry);
-                    var directoryInfo = new DirectoryInfo(entry);
-                    var isDirectory = directoryInfo.Exists;
-                    var stat = (FileSystemInfo)(isDirectory ? directoryInfo : fileInfo);
-
-                    items.Add(new
-                    {
-                        name,
-                        path = entry,
-                        is_directory = isDirectory,
-                        size = isDirectory ? (long?)null : fileInfo.Length,
-                        modified = stat.LastWriteTime.ToString("yyyy-MM-dd HH:mm", CultureInfo.InvariantCulture)
-                    });
-                }
-                catch
-                {
-                    // Skip inaccessible entries.
-                }
-            }
-
-            var ordered = items
-                .Cast<dynamic>()
-                .OrderBy(item => !(bool)item.is_directory)
-                .ThenBy(item => ((string)item.name).ToLowerInvariant())
-                .Cast<object>()
-                .ToList();
+            var maxResults = limit > 0 ? Math.Min(limit, MaxSearchResults) : MaxSearchResults;
+            var items = depth > 0
+                ? SearchTree(path, query, Math.Min(depth, MaxSearchDepth), maxResults + 1)
+                : ReadItems(path, query);
+            var truncated = depth > 0 && items.Count > maxResults;
 
             return new
             {
@@ -251,7 +269,9 @@ internal sealed class FileExplorerService
                 action = "search",
                 path,
                 query,
-                files = ordered
+                files = SortPage(items, 0, depth > 0 ? maxResults : limit),
+                total = truncated ? (int?)null : items.Count,
+                truncated
             };
         }
         catch (Exception ex)
@@ -419,13 +439,14 @@ internal sealed class FileExplorerService
                 return Error("Not a file");
             }
 
-            var fileInfo = new FileInfo(path);
-            if (fileInfo.Length > _maxReadSize)
+            using var handle = File.OpenHandle(path);
+            var length = RandomAccess.GetLength(handle);
+            if (length > _maxReadSize)
             {
-                return Error($"File too large ({fileInfo.Length} bytes). Max: {_maxReadSize} bytes");
+                return Error($"File too large ({length} bytes). Max: {_maxReadSize} bytes");
             }
 
-            var content = File.ReadAllText(path);
+            var content = ReadText(handle, (int)length);
             return new
             {
                 type = "file_explorer",
@@ -445,6 +466,40 @@ internal sealed class FileExplorerService
         }
     }
 
+    private static string ReadText(SafeFileHandle handle, int length)
+    {
+        var buffer = ArrayPool<byte>.Shared.Rent(length);
+        try
+        {
+            var read = 0;
+            while (read < length)
+            {
+                var count = RandomAccess.Read(handle, buffer.AsSpan(read, length - read), read);
+                if (count == 0)
+                {
+                    break;
+                }
+
+                read += count;
+            }
+
+            var bytes = buffer.AsSpan(0, read);
+            return bytes switch
+            {
+                [0xEF, 0xBB, 0xBF, ..] => Encoding.UTF8.GetString(bytes[3..]),
+                [0xFF, 0xFE, 0x00, 0x00, ..] => Encoding.UTF32.GetString(bytes[4..]),
+                [0x00, 0x00, 0xFE, 0xFF, ..] => new UTF32Encoding(bigEndian: true, byteOrderMark: false).GetString(bytes[4..]),
+                [0xFF, 0xFE, ..] => Encoding.Unicode.GetString(bytes[2..]),
+                [0xFE, 0xFF, ..] => Encoding.BigEndianUnicode.GetString(bytes[2..]),
+                _ => Encoding.UTF8.GetString(bytes)
+            };
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+
     private object WriteFile(string path, string content)
     {
         if (!ValidatePath(path))
@@ -546,10 +601,8 @@ internal sealed class FileExplorerService
         try
         {
             var resolved = Path.GetFullPath(path);
-            return DriveInfo.GetDrives()
-                .Select(drive => drive.Name)
-                .Where(root => !string.IsNullOrWhiteSpace(root))
-                .Any(root => resolved.StartsWith(Path.GetFullPath(root), StringComparison.OrdinalIgnoreCase));
+            var root = Path.GetPathRoot(resolved);
+            return !string.IsNullOrEmpty(root) && GetDriveRoots().Contains(root);
         }
         catch
         {
@@ -557,6 +610,23 @@ internal sealed class FileExplorerService
         }
     }
 
+    private HashSet<string> GetDriveRoots()
+    {
+        var cached = _driveRoots;
+        if (cached is not null && Stopwatch.GetElapsedTime(cached.LoadedAt) < DriveRootsFreshness)
+        {
+            return cached.Roots;
+        }
+
+        var roots = DriveInfo.GetDrives()
+            .Select(drive => drive.Name)
+            .Where(root => !string.IsNullOrWhiteSpace(root))
+            .Select(Path.GetFullPath)
+            .ToHashSet(StringComparer.OrdinalIgnoreCase);
+        _driveRoots = new DriveRoots(roots, Stopwatch.GetTimestamp());
+        return roots;
+    }
+
     private static object Error(string message)
         => new { type = "file_explorer", action = "error", message };
 
@@ -572,20 +642,139 @@ internal sealed class FileExplorerService
         return fallback;
     }
 
+    private static int GetInt32(JsonElement element, string propertyName, int fallback = 0)
+    {
+        if (element.ValueKind == JsonValueKind.Object &&
+            element.TryGetProperty(propertyName, out var prop) &&
+            prop.ValueKind == JsonValueKind.Number &&
+            prop.TryGetInt32(out var value))
+        {
+            return value;
+        }
+
+        return fallback;
+    }
+
+    private static List<FileItem> ReadItems(string path, string? query)
+    {
+        var modifiedLabels = new Dictionary<long, string>();
+        var entries = new FileSystemEnumerable<FileItem>(
+            path,
+            (ref FileSystemEntry entry) => CreateItem(ref entry, modifiedLabels),
+            ListingOptions);
+
+        if (!string.IsNullOrEmpty(query))
+        {
+            entries.ShouldIncludePredicate = (ref FileSystemEntry entry) => entry.FileName.Contains(query, StringComparison.OrdinalIgnoreCase);
+        }
+
+        return entries.ToList();
+    }
+
+    private static List<string> ReadNames(string path)
+    {
+        return new FileSystemEnumerable<string>(
+            path,
+            (ref FileSystemEntry entry) => entry.FileName.ToString(),
+            ListingOptions).ToList();
+    }
+
+    private static List<FileItem> SearchTree(string path, string query, int depth, int maxResults)
+    {
+        var results = new ConcurrentBag<FileItem>(ReadItems(path, query).Take(maxResults));
+        var found = results.Count;
+        var level = Directory.EnumerateDirectories(path, "*", SubdirectoryOptions).ToList();
+        for (var current = 1; current <= depth && level.Count > 0 && Volatile.Read(ref found) < maxResults; current++)
+        {
+            var next = new ConcurrentBag<string>();
+            var descend = current < depth;
+            Parallel.ForEach(level, SearchParallelism, (directory, loop) =>
+            {
+                try
+                {
+                    foreach (var item in ReadItems(directory, query))
+                    {
+                        if (Interlocked.Increment(ref found) > maxResults)
+                        {
+                            loop.Stop();
+                            return;
+                        }
+
+                        results.Add(item);
+                    }
+
+                    if (descend)
+                    {
+                        foreach (var child in Directory.EnumerateDirectories(directory, "*", SubdirectoryOptions))
+                        {
+                            next.Add(child);
+                        }
+                    }
+                }
+                catch
+                {
+                    // Skip inaccessible directories.
+                }
+            });
+
+            level = next.ToList();
+        }
+
+        return results.ToList();
+    }
+
+    private static List<FileItem> SortPage(List<FileItem> items, int offset, int limit)
+    {
+        var ordered = items
+            .OrderBy(item => !item.IsDirectory)
+            .ThenBy(item => item.Name, StringComparer.OrdinalIgnoreCase);
+
+        return limit > 0
+            ? ordered.Skip(offset).Take(limit).ToList()
+            : ordered.ToList();
+    }
+
+    private static FileItem CreateItem(ref FileSystemEntry entry, Dictionary<long, string> modifiedLabels)
+    {
+        var isDirectory = entry.IsDirectory;
+        return new FileItem
+        {
+            Name = entry.FileName.ToString(),
+            FilePath = entry.ToFullPath(),
+            IsDirectory = isDirectory,
+            Size = isDirectory ? null : entry.Length,
+            Modified = FormatModified(entry.LastWriteTimeUtc.LocalDateTime, modifiedLabels)
+        };
+    }
+
+    private static string FormatModified(DateTime modified, Dictionary<long, string> labels)
+    {
+        var minute = modified.Ticks / TimeSpan.TicksPerMinute;
+        if (!labels.TryGetValue(minute, out var label))
+        {
+            label = modified.ToString(ModifiedFormat, CultureInfo.InvariantCulture);
+            labels[minute] = label;
+        }
+
+        return label;
+    }
+
     private static void CopyDirectory(string source, string destination)
     {
         Directory.CreateDirectory(destination);
-        foreach (var directory in Directory.GetDirectories(source))
+        foreach (var directory in Directory.EnumerateDirectories(source))
         {
             CopyDirectory(directory, Path.Combine(destination, Path.GetFileName(directory)));
         }
 
-        foreach (var file in Directory.GetFiles(source))
+        foreach (var file in Directory.EnumerateFiles(source))
         {
             File.Copy(file, Path.Combine(destination, Path.GetFileName(file)), overwrite: false);
         }
     }
 
+    private sealed record DriveRoots(HashSet<string> Roots, long LoadedAt);
+
     private sealed class FileItem
     {
         [JsonPropertyName("name")]
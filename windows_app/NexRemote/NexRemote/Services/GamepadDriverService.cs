@@ -1,5 +1,6 @@
 using System;
 using System.Diagnostics;
+using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Win32;
 
@@ -15,22 +16,35 @@ public interface IGamepadDriverService
 
 public sealed class GamepadDriverService : IGamepadDriverService
 {
-    public bool IsViGEmBusInstalled() => QueryViGEmBusInstalled();
+    private int _installedState = -1;
 
-    public Task<bool> IsViGEmBusInstalledAsync() => Task.Run(QueryViGEmBusInstalled);
+    public bool IsViGEmBusInstalled()
+    {
+        var state = Volatile.Read(ref _installedState);
+        return state >= 0 ? state == 1 : RefreshInstalledState();
+    }
+
+    public Task<bool> IsViGEmBusInstalledAsync() => Task.Run(RefreshInstalledState);
 
-    public bool IsNativeTransportReady() => QueryViGEmBusInstalled();
+    public bool IsNativeTransportReady() => IsViGEmBusInstalled();
 
-    public Task<bool> IsNativeTransportReadyAsync() => Task.Run(IsNativeTransportReady);
+    public Task<bool> IsNativeTransportReadyAsync() => IsViGEmBusInstalledAsync();
+
+    private bool RefreshInstalledState()
+    {
+        var installed = QueryViGEmBusInstalled();
+        Volatile.Write(ref _installedState, installed ? 1 : 0);
+        return installed;
+    }
 
     private static bool QueryViGEmBusInstalled()
     {
-        if (TryQueryService())
+        if (TryReadServiceRegistry())
         {
             return true;
         }
 
-        if (TryReadServiceRegistry())
+        if (TryQueryService())
         {
             return true;
         }
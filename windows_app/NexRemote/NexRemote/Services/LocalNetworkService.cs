@@ -1,17 +1,77 @@
+using System;
+using System.Diagnostics;
 using System.Net;
+using System.Net.NetworkInformation;
 using System.Net.Sockets;
+using System.Threading.Tasks;
 
 namespace NexRemote.Services;
 
 public interface ILocalNetworkService
 {
-    string GetLanIpAddress();
+    Task<string> GetLanIpAddressAsync();
+    void InvalidateLanIpAddress();
 }
 
 public sealed class LocalNetworkService : ILocalNetworkService
 {
-    public string GetLanIpAddress()
+    private static readonly TimeSpan LanIpFreshness = TimeSpan.FromSeconds(30);
+
+    private volatile CachedLanIp? _cached;
+
+    public Task<string> GetLanIpAddressAsync()
     {
+        var cached = _cached;
+        if (cached is not null && Stopwatch.GetElapsedTime(cached.ResolvedAt) < LanIpFreshness)
+        {
+            return Task.FromResult(cached.Address);
+        }
+
+        return Task.Run(() =>
+        {
+            var address = ResolveLanIpAddress();
+            _cached = new CachedLanIp(address, Stopwatch.GetTimestamp());
+            return address;
+        });
+    }
+
+    public void InvalidateLanIpAddress() => _cached = null;
+
+    private static string ResolveLanIpAddress()
+    {
+        try
+        {
+            foreach (var networkInterface in NetworkInterface.GetAllNetworkInterfaces())
+            {
+                if (networkInterface.OperationalStatus != OperationalStatus.Up ||
+                    networkInterface.NetworkInterfaceType is NetworkInterfaceType.Loopback or NetworkInterfaceType.Tunnel)
+                {
+                    continue;
+                }
+
+                var properties = networkInterface.GetIPProperties();
+                if (properties.GatewayAddresses.Count == 0)
+                {
+                    continue;
+                }
+
+                foreach (var unicast in properties.UnicastAddresses)
+                {
+                    var address = unicast.Address;
+                    if (address.AddressFamily == AddressFamily.InterNetwork &&
+                        !IPAddress.IsLoopback(address) &&
+                        !address.ToString().StartsWith("169.254.", StringComparison.Ordinal))
+                    {
+                        return address.ToString();
+                    }
+                }
+            }
+        }
+        catch
+        {
+            // fall back to the routing probe below
+        }
+
         try
         {
             using var socket = new Socket(AddressFamily.InterNetwork, SocketType.Dgram, ProtocolType.Udp);
@@ -28,4 +88,6 @@ public sealed class LocalNetworkService : ILocalNetworkService
 
         return IPAddress.Loopback.ToString();
     }
+
+    private sealed record CachedLanIp(string Address, long ResolvedAt);
 }
@@ -1,4 +1,5 @@
 using System;
+using System.Buffers.Text;
 using System.Security.Cryptography;
 using System.Text;
 
@@ -8,6 +9,7 @@ public interface IMessageEncryptionService
 {
     string EncryptToBase64(string payload);
     byte[] EncryptToBase64Bytes(string payload);
+    byte[] EncryptToBase64Bytes(byte[] payload);
     string DecryptFromBase64(string payload);
     string DecryptFromBase64Bytes(byte[] payload);
 }
@@ -19,9 +21,10 @@ public sealed class MessageEncryptionService : IMessageEncryptionService
 
     public string EncryptToBase64(string payload) => Encoding.UTF8.GetString(EncryptToBase64Bytes(payload));
 
-    public byte[] EncryptToBase64Bytes(string payload)
+    public byte[] EncryptToBase64Bytes(string payload) => EncryptToBase64Bytes(Encoding.UTF8.GetBytes(payload));
+
+    public byte[] EncryptToBase64Bytes(byte[] payload)
     {
-        var plainBytes = Encoding.UTF8.GetBytes(payload);
         using var aes = Aes.Create();
         aes.Key = KeyBytes;
         aes.IV = ZeroIv;
@@ -29,8 +32,10 @@ public sealed class MessageEncryptionService : IMessageEncryptionService
         aes.Padding = PaddingMode.PKCS7;
 
         using var encryptor = aes.CreateEncryptor();
-        var encrypted = encryptor.TransformFinalBlock(plainBytes, 0, plainBytes.Length);
-        return Encoding.UTF8.GetBytes(Convert.ToBase64String(encrypted));
+        var encrypted = encryptor.TransformFinalBlock(payload, 0, payload.Length);
+        var result = new byte[Base64.GetMaxEncodedToUtf8Length(encrypted.Length)];
+        Base64.EncodeToUtf8(encrypted, result, out _, out _);
+        return result;
     }
 
     public string DecryptFromBase64(string payload)
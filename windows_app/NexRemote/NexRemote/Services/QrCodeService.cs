@@ -1,33 +1,76 @@
 using System;
-using System.IO;
+using System.Runtime.InteropServices;
+using System.Runtime.InteropServices.WindowsRuntime;
 using System.Threading.Tasks;
 using Microsoft.UI.Xaml.Media.Imaging;
-using NexRemote.Helpers;
 using QRCoder;
 
 namespace NexRemote.Services;
 
 public interface IQrCodeService
 {
-    Task<BitmapImage?> CreateAsync(string payload);
+    Task<WriteableBitmap?> CreateAsync(string payload);
 }
 
 public sealed class QrCodeService : IQrCodeService
 {
-    public async Task<BitmapImage?> CreateAsync(string payload)
+    private const int TargetPixelSize = 440;
+    private const uint DarkPixel = 0xFF000000;
+    private const uint LightPixel = 0xFFFFFFFF;
+
+    private CachedQrCode? _cached;
+
+    public async Task<WriteableBitmap?> CreateAsync(string payload)
     {
         if (string.IsNullOrWhiteSpace(payload))
         {
             return null;
         }
 
+        if (_cached is { } cached && string.Equals(cached.Payload, payload, StringComparison.Ordinal))
+        {
+            return cached.Image;
+        }
+
+        var raster = await Task.Run(() => Rasterize(payload));
+        var image = new WriteableBitmap(raster.Size, raster.Size);
+        using (var stream = image.PixelBuffer.AsStream())
+        {
+            stream.Write(MemoryMarshal.AsBytes(raster.Pixels.AsSpan()));
+        }
+
+        image.Invalidate();
+        _cached = new CachedQrCode(payload, image);
+        return image;
+    }
+
+    private static QrRaster Rasterize(string payload)
+    {
         using var generator = new QRCodeGenerator();
         using var data = generator.CreateQrCode(payload, QRCodeGenerator.ECCLevel.M);
-        var png = new PngByteQRCode(data).GetGraphic(18);
-        var cacheDir = Path.Combine(PathHelper.GetAppDataRoot(), "cache");
-        Directory.CreateDirectory(cacheDir);
-        var filePath = Path.Combine(cacheDir, "quick-connect-qr.png");
-        await File.WriteAllBytesAsync(filePath, png);
-        return new BitmapImage(new Uri(filePath, UriKind.Absolute));
+        var matrix = data.ModuleMatrix;
+        var pixelsPerModule = Math.Max(1, TargetPixelSize / matrix.Count);
+        var size = matrix.Count * pixelsPerModule;
+        var pixels = new uint[size * size];
+        for (var moduleY = 0; moduleY < matrix.Count; moduleY++)
+        {
+            var modules = matrix[moduleY];
+            var firstRow = pixels.AsSpan(moduleY * pixelsPerModule * size, size);
+            for (var moduleX = 0; moduleX < matrix.Count; moduleX++)
+            {
+                firstRow.Slice(moduleX * pixelsPerModule, pixelsPerModule).Fill(modules[moduleX] ? DarkPixel : LightPixel);
+            }
+
+            for (var repeat = 1; repeat < pixelsPerModule; repeat++)
+            {
+                firstRow.CopyTo(pixels.AsSpan((moduleY * pixelsPerModule + repeat) * size, size));
+            }
+        }
+
+        return new QrRaster(size, pixels);
     }
+
+    private readonly record struct QrRaster(int Size, uint[] Pixels);
+
+    private sealed record CachedQrCode(string Payload, WriteableBitmap Image);
 }
@@ -1,4 +1,5 @@
 using System;
+using System.Diagnostics;
 using System.Linq;
 using System.Net.WebSockets;
 using System.Text.Json;
@@ -10,6 +11,8 @@ namespace NexRemote.Services;
 
 public sealed partial class RemoteServerHost
 {
+    private const int CameraStreamFps = 10;
+
     private async Task HandleScreenShareAsync(RemoteClientSession session, JsonElement message, CancellationToken cancellationToken)
     {
         var action = GetString(message, "action").ToLowerInvariant();
@@ -79,7 +82,7 @@ public sealed partial class RemoteServerHost
                 break;
             case "list_displays":
             {
-                var monitors = _screenCaptureService.GetMonitors();
+                var monitors = _screenCaptureService.RefreshMonitors();
                 await SendEncryptedAsync(session, new
                 {
                     type = "screen_share",
@@ -131,6 +134,23 @@ public sealed partial class RemoteServerHost
         }
     }
 
+    private async Task HandleFileExplorerAsync(RemoteClientSession session, JsonElement message, CancellationToken cancellationToken)
+    {
+        try
+        {
+            var response = await _fileExplorerService.HandleRequestAsync(message).ConfigureAwait(false);
+            await SendEncryptedAsync(session, response, cancellationToken).ConfigureAwait(false);
+        }
+        catch (OperationCanceledException)
+        {
+            // ignored
+        }
+        catch (Exception ex)
+        {
+            _logger.LogDebug(ex, "File explorer request failed");
+        }
+    }
+
     private async Task HandleCameraAsync(RemoteClientSession session, JsonElement message, CancellationToken cancellationToken)
     {
         var action = GetString(message, "action").ToLowerInvariant();
@@ -305,25 +325,25 @@ public sealed partial class RemoteServerHost
             existing.Dispose();
         }
 
-        var monitor = _screenCaptureService.GetMonitors().FirstOrDefault(display => display.Index == displayIndex) ?? _screenCaptureService.GetMonitors().First();
+        var monitor = _screenCaptureService.GetMonitor(displayIndex);
         var loopCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
         session.ScreenTasks[displayIndex] = loopCts;
 
         _ = Task.Run(async () =>
         {
+            using var capture = _screenCaptureService.CreateStream(monitor, BuildFramePrefix(ProtocolConstants.ScreenFrameHeader, (byte)(displayIndex & 0xFF)));
+            var nextFrameAt = Stopwatch.GetTimestamp();
             try
             {
                 while (!loopCts.IsCancellationRequested && session.Socket.State == WebSocketState.Open)
                 {
-                    var frame = _screenCaptureService.CaptureFrame(monitor, session.ScreenResolution, session.ScreenQuality);
-                    if (frame.Length > 0)
+                    var frame = capture.CaptureFrame(session.ScreenResolution, session.ScreenQuality);
+                    if (!frame.IsEmpty)
                     {
-                        var payload = BuildBinaryFrame(ProtocolConstants.ScreenFrameHeader, (byte)(displayIndex & 0xFF), frame);
-                        await session.TrySendBinaryAsync(payload, loopCts.Token).ConfigureAwait(false);
+                        await session.TrySendBinaryAsync(frame, loopCts.Token).ConfigureAwait(false);
                     }
 
-                    var delay = Math.Max(1, 1000 / Math.Max(1, session.ScreenFps));
-                    await Task.Delay(delay, loopCts.Token).ConfigureAwait(false);
+                    nextFrameAt = await WaitForNextFrameAsync(nextFrameAt, session.ScreenFps, loopCts.Token).ConfigureAwait(false);
                 }
             }
             catch (OperationCanceledException)
@@ -373,6 +393,8 @@ public sealed partial class RemoteServerHost
 
         _ = Task.Run(async () =>
         {
+            var nextFrameAt = Stopwatch.GetTimestamp();
+            byte[]? lastSentFrame = null;
             try
             {
                 while (!loopCts.IsCancellationRequested && session.Socket.State == WebSocketState.Open)
@@ -396,9 +418,16 @@ public sealed partial class RemoteServerHost
                         break;
                     }
 
-                    var payload = BuildBinaryFrame(ProtocolConstants.CameraFrameHeader, (byte)(cameraIndex & 0xFF), frame);
-                    await session.TrySendBinaryAsync(payload, loopCts.Token).ConfigureAwait(false);
-                    await Task.Delay(100, loopCts.Token).ConfigureAwait(false);
+                    if (!ReferenceEquals(frame, lastSentFrame))
+                    {
+                        var payload = BuildBinaryFrame(ProtocolConstants.CameraFrameHeader, (byte)(cameraIndex & 0xFF), frame);
+                        if (await session.TrySendBinaryAsync(payload, loopCts.Token).ConfigureAwait(false))
+                        {
+                            lastSentFrame = frame;
+                        }
+                    }
+
+                    nextFrameAt = await WaitForNextFrameAsync(nextFrameAt, CameraStreamFps, loopCts.Token).ConfigureAwait(false);
                 }
             }
             catch (OperationCanceledException)
@@ -419,6 +448,19 @@ public sealed partial class RemoteServerHost
         }, loopCts.Token);
     }
 
+    private static async Task<long> WaitForNextFrameAsync(long nextFrameAt, int fps, CancellationToken cancellationToken)
+    {
+        nextFrameAt += Stopwatch.Frequency / Math.Max(1, fps);
+        var now = Stopwatch.GetTimestamp();
+        if (nextFrameAt <= now)
+        {
+            return now;
+        }
+
+        await Task.Delay(Stopwatch.GetElapsedTime(now, nextFrameAt), cancellationToken).ConfigureAwait(false);
+        return nextFrameAt;
+    }
+
     private void StopCameraStreams(RemoteClientSession session, int? cameraIndex)
     {
         var keys = cameraIndex.HasValue
@@ -528,14 +570,7 @@ public sealed partial class RemoteServerHost
 
     private Task HandleScreenShareInputAsync(JsonElement message)
     {
-        var monitors = _screenCaptureService.GetMonitors();
-        var monitorIndex = ReadInt32(message, "monitor_index", 0);
-        var monitor = monitors.FirstOrDefault(display => display.Index == monitorIndex) ?? monitors.FirstOrDefault();
-        if (monitor is null)
-        {
-            return Task.CompletedTask;
-        }
-
+        var monitor = _screenCaptureService.GetMonitor(ReadInt32(message, "monitor_index", 0));
         var x = ResolveScreenCoordinate(message, "normalized_x", "x", monitor.Bounds.Left, monitor.Bounds.Width);
         var y = ResolveScreenCoordinate(message, "normalized_y", "y", monitor.Bounds.Top, monitor.Bounds.Height);
         var inputAction = GetString(message, "input_action", GetString(message, "action")).ToLowerInvariant();
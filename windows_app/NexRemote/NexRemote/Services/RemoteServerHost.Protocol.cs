@@ -170,7 +170,7 @@ public sealed partial class RemoteServerHost
                 continue;
             }
 
-            var protocolMessage = JsonSerializer.Deserialize<ProtocolMessage>(message.GetRawText(), ProtocolJson.SharedOptions);
+            var protocolMessage = message.Deserialize<ProtocolMessage>(ProtocolJson.SharedOptions);
             if (protocolMessage is not null)
             {
                 RaiseMessageReceived(session.ClientId, protocolMessage);
@@ -236,7 +236,13 @@ public sealed partial class RemoteServerHost
                     await HandleCameraAsync(session, message, cancellationToken).ConfigureAwait(false);
                     break;
                 case "file_explorer":
-                    await SendEncryptedAsync(session, await _fileExplorerService.HandleRequestAsync(message).ConfigureAwait(false), cancellationToken).ConfigureAwait(false);
+                    if (FileExplorerService.IsLongRunning(message))
+                    {
+                        _ = Task.Run(() => HandleFileExplorerAsync(session, message, cancellationToken), cancellationToken);
+                        break;
+                    }
+
+                    await HandleFileExplorerAsync(session, message, cancellationToken).ConfigureAwait(false);
                     break;
                 case "screen_share":
                     await HandleScreenShareAsync(session, message, cancellationToken).ConfigureAwait(false);
@@ -260,9 +266,9 @@ public sealed partial class RemoteServerHost
     private bool TryParseInboundMessage(string payload, out JsonElement message)
     {
         message = default;
-        if (TryParseJson(payload, out message))
+        if (LooksLikeJsonObject(payload))
         {
-            return true;
+            return TryParseJson(payload, out message);
         }
 
         try
@@ -276,6 +282,12 @@ public sealed partial class RemoteServerHost
         }
     }
 
+    private static bool LooksLikeJsonObject(string payload)
+    {
+        var trimmed = payload.AsSpan().TrimStart();
+        return !trimmed.IsEmpty && trimmed[0] == '{';
+    }
+
     private static bool TryParseJson(string payload, out JsonElement element)
     {
         try
@@ -344,21 +356,28 @@ public sealed partial class RemoteServerHost
 
     private async Task SendEncryptedAsync(RemoteClientSession session, object payload, CancellationToken cancellationToken)
     {
-        var json = JsonSerializer.Serialize(payload, ProtocolJson.SharedOptions);
-        var encrypted = _encryptionService.EncryptToBase64(json);
+        var json = JsonSerializer.SerializeToUtf8Bytes(payload, ProtocolJson.SharedOptions);
+        var encrypted = _encryptionService.EncryptToBase64Bytes(json);
         await session.SendTextAsync(encrypted, cancellationToken).ConfigureAwait(false);
     }
 
-    private static byte[] BuildBinaryFrame(string header, byte index, byte[] payload)
+    private static byte[] BuildBinaryFrame(string header, byte index, ReadOnlySpan<byte> payload)
     {
-        var headerBytes = Encoding.ASCII.GetBytes(header);
-        var result = new byte[headerBytes.Length + 1 + payload.Length];
-        Buffer.BlockCopy(headerBytes, 0, result, 0, headerBytes.Length);
-        result[headerBytes.Length] = index;
-        Buffer.BlockCopy(payload, 0, result, headerBytes.Length + 1, payload.Length);
+        var prefix = BuildFramePrefix(header, index);
+        var result = new byte[prefix.Length + payload.Length];
+        Buffer.BlockCopy(prefix, 0, result, 0, prefix.Length);
+        payload.CopyTo(result.AsSpan(prefix.Length));
         return result;
     }
 
+    private static byte[] BuildFramePrefix(string header, byte index)
+    {
+        var prefix = new byte[Encoding.ASCII.GetByteCount(header) + 1];
+        Encoding.ASCII.GetBytes(header, prefix);
+        prefix[^1] = index;
+        return prefix;
+    }
+
     private bool TryHandleHybridGamepadInput(JsonElement message)
     {
         if (!string.Equals(GetString(message, "input_type"), "button", StringComparison.OrdinalIgnoreCase))
@@ -42,7 +42,12 @@ public sealed partial class RemoteServerHost
         public async Task SendTextAsync(string payload, CancellationToken cancellationToken = default)
         {
             var bytes = Encoding.UTF8.GetBytes(payload);
-            await SendAsync(bytes, WebSocketMessageType.Text, cancellationToken).ConfigureAwait(false);
+            await SendTextAsync(bytes, cancellationToken).ConfigureAwait(false);
+        }
+
+        public async Task SendTextAsync(byte[] utf8Payload, CancellationToken cancellationToken = default)
+        {
+            await SendAsync(utf8Payload, WebSocketMessageType.Text, cancellationToken).ConfigureAwait(false);
         }
 
         public async Task SendBinaryAsync(byte[] payload, CancellationToken cancellationToken = default)
@@ -50,7 +55,7 @@ public sealed partial class RemoteServerHost
             await SendAsync(payload, WebSocketMessageType.Binary, cancellationToken).ConfigureAwait(false);
         }
 
-        public async Task<bool> TrySendBinaryAsync(byte[] payload, CancellationToken cancellationToken = default)
+        public async Task<bool> TrySendBinaryAsync(ReadOnlyMemory<byte> payload, CancellationToken cancellationToken = default)
         {
             if (Socket.State != WebSocketState.Open)
             {
@@ -66,7 +71,7 @@ public sealed partial class RemoteServerHost
             {
                 if (Socket.State == WebSocketState.Open)
                 {
-                    await Socket.SendAsync(payload.AsMemory(), WebSocketMessageType.Binary, true, cancellationToken).ConfigureAwait(false);
+                    await Socket.SendAsync(payload, WebSocketMessageType.Binary, true, cancellationToken).ConfigureAwait(false);
                     return true;
                 }
 
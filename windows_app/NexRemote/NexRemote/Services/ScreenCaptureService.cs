@@ -1,19 +1,72 @@
 using System;
 using System.Collections.Generic;
+using System.ComponentModel;
+using System.Diagnostics;
 using System.Drawing;
 using System.Drawing.Imaging;
 using System.IO;
 using System.Linq;
 using System.Runtime.InteropServices;
+using System.Runtime.Intrinsics;
 
 namespace NexRemote.Services;
 
 internal sealed class ScreenCaptureService
 {
+    private const int SmCxscreen = 0;
+    private const int SmCyscreen = 1;
+    private const int SmXvirtualscreen = 76;
+    private const int SmYvirtualscreen = 77;
+    private const int SmCxvirtualscreen = 78;
+    private const int SmCyvirtualscreen = 79;
+    private const int SmCmonitors = 80;
+    private static readonly int[] BoxFactors = { 2, 4 };
+    private static readonly TimeSpan UnchangedFrameResendInterval = TimeSpan.FromSeconds(1);
+    private static readonly TimeSpan MonitorLayoutCheckInterval = TimeSpan.FromSeconds(5);
+
+    private static readonly ImageCodecInfo? JpegEncoder =
+        ImageCodecInfo.GetImageEncoders().FirstOrDefault(codec => codec.FormatID == ImageFormat.Jpeg.Guid);
+
+    private volatile MonitorSnapshot? _snapshot;
+
+    public ScreenCaptureService()
+    {
+        RefreshMonitors();
+    }
+
     public sealed record ScreenDisplayInfo(int Index, string Name, int Width, int Height, bool IsPrimary, Rectangle Bounds);
 
     public IReadOnlyList<ScreenDisplayInfo> GetMonitors()
     {
+        var snapshot = _snapshot;
+        if (snapshot is null)
+        {
+            return RefreshMonitors();
+        }
+
+        if (Stopwatch.GetElapsedTime(snapshot.CheckedAt) < MonitorLayoutCheckInterval)
+        {
+            return snapshot.Monitors;
+        }
+
+        if (snapshot.Layout != ReadMonitorLayout())
+        {
+            return RefreshMonitors();
+        }
+
+        _snapshot = snapshot with { CheckedAt = Stopwatch.GetTimestamp() };
+        return snapshot.Monitors;
+    }
+
+    public ScreenDisplayInfo GetMonitor(int index)
+    {
+        var monitors = GetMonitors();
+        return monitors.FirstOrDefault(display => display.Index == index) ?? monitors[0];
+    }
+
+    public IReadOnlyList<ScreenDisplayInfo> RefreshMonitors()
+    {
+        var layout = ReadMonitorLayout();
         var result = new List<ScreenDisplayInfo>();
         EnumDisplayMonitors(IntPtr.Zero, IntPtr.Zero, (monitor, _, _, lParam) =>
         {
@@ -34,28 +87,361 @@ internal sealed class ScreenCaptureService
             result.Add(new ScreenDisplayInfo(0, "Primary Display", 1920, 1080, true, new Rectangle(0, 0, 1920, 1080)));
         }
 
+        _snapshot = new MonitorSnapshot(result, layout, Stopwatch.GetTimestamp());
         return result;
     }
 
-    public byte[] CaptureFrame(ScreenDisplayInfo monitor, string resolution, int quality)
+    private static MonitorLayout ReadMonitorLayout() => new(
+        GetSystemMetrics(SmCmonitors),
+        new Size(GetSystemMetrics(SmCxscreen), GetSystemMetrics(SmCyscreen)),
+        new Rectangle(
+            GetSystemMetrics(SmXvirtualscreen),
+            GetSystemMetrics(SmYvirtualscreen),
+            GetSystemMetrics(SmCxvirtualscreen),
+            GetSystemMetrics(SmCyvirtualscreen)));
+
+    public ScreenCaptureStream CreateStream(ScreenDisplayInfo monitor, byte[] framePrefix) => new(this, monitor, framePrefix);
+
+    internal sealed class ScreenCaptureStream : IDisposable
+    {
+        private readonly ScreenCaptureService _owner;
+        private readonly byte[] _framePrefix;
+        private ScreenDisplayInfo _monitor;
+        private IReadOnlyList<ScreenDisplayInfo>? _resolvedFrom;
+        private DesktopSurface? _surface;
+        private DesktopSurface? _sourceSurface;
+        private string? _resolution;
+        private Size _targetSize;
+        private int _boxFactor;
+        private byte[] _previousPixels = Array.Empty<byte>();
+        private readonly MemoryStream _output = new();
+        private ReadOnlyMemory<byte> _lastFrame = ReadOnlyMemory<byte>.Empty;
+        private int _lastQuality;
+        private EncoderParameters? _encoderParameters;
+        private int _lastEncoderQuality;
+        private long _lastFrameAt;
+        private bool _disposed;
+
+        public ScreenCaptureStream(ScreenCaptureService owner, ScreenDisplayInfo monitor, byte[] framePrefix)
+        {
+            _owner = owner;
+            _monitor = monitor;
+            _framePrefix = framePrefix;
+            timeBeginPeriod(1);
+        }
+
+        public ReadOnlyMemory<byte> CaptureFrame(string resolution, int quality)
+        {
+            ThrowIfDisposed();
+
+            ResolveMonitor(_owner.GetMonitors());
+            var bounds = _monitor.Bounds;
+            if (!string.Equals(resolution, _resolution, StringComparison.Ordinal))
+            {
+                _resolution = resolution;
+                _targetSize = GetTargetSize(bounds.Size, resolution);
+                _boxFactor = GetBoxFactor(bounds.Size, _targetSize);
+            }
+
+            var surface = EnsureSurface(ref _surface, _targetSize);
+            try
+            {
+                CopyFromScreen(surface, bounds);
+            }
+            catch (Win32Exception)
+            {
+                if (ResolveMonitor(_owner.GetMonitors()))
+                {
+                    return ReadOnlyMemory<byte>.Empty;
+                }
+
+                throw;
+            }
+
+            var pixels = surface.Pixels;
+            if (quality == _lastQuality && pixels.SequenceEqual(_previousPixels))
+            {
+                if (Stopwatch.GetElapsedTime(_lastFrameAt) < UnchangedFrameResendInterval)
+                {
+                    return ReadOnlyMemory<byte>.Empty;
+                }
+
+                _lastFrameAt = Stopwatch.GetTimestamp();
+                return _lastFrame;
+            }
+
+            if (_previousPixels.Length != pixels.Length)
+            {
+                _previousPixels = new byte[pixels.Length];
+            }
+
+            pixels.CopyTo(_previousPixels);
+            _lastQuality = quality;
+            _output.SetLength(0);
+            _output.Write(_framePrefix);
+            EncodeJpeg(surface.Bitmap, GetEncoderParameters(quality), _output);
+            _lastFrame = _output.GetBuffer().AsMemory(0, (int)_output.Length);
+            _lastFrameAt = Stopwatch.GetTimestamp();
+            return _lastFrame;
+        }
+
+        public void Dispose()
+        {
+            if (_disposed)
+            {
+                return;
+            }
+
+            _disposed = true;
+            timeEndPeriod(1);
+            _surface?.Dispose();
+            _surface = null;
+            _sourceSurface?.Dispose();
+            _sourceSurface = null;
+            _output.Dispose();
+            _encoderParameters?.Dispose();
+            _encoderParameters = null;
+        }
+
+        private bool ResolveMonitor(IReadOnlyList<ScreenDisplayInfo> monitors)
+        {
+            if (ReferenceEquals(monitors, _resolvedFrom))
+            {
+                return false;
+            }
+
+            _resolvedFrom = monitors;
+            var monitor = monitors.FirstOrDefault(display => display.Index == _monitor.Index);
+            if (monitor is null || monitor.Bounds == _monitor.Bounds)
+            {
+                return false;
+            }
+
+            _monitor = monitor;
+            _resolution = null;
+            return true;
+        }
+
+        private void CopyFromScreen(DesktopSurface surface, Rectangle bounds)
+        {
+            if (_boxFactor > 1)
+            {
+                var source = EnsureSurface(ref _sourceSurface, bounds.Size);
+                source.CopyFromScreen(bounds);
+                BoxDownsample(source, surface, _boxFactor);
+                return;
+            }
+
+            _sourceSurface?.Dispose();
+            _sourceSurface = null;
+            surface.CopyFromScreen(bounds);
+        }
+
+        private EncoderParameters GetEncoderParameters(int quality)
+        {
+            quality = Math.Clamp(quality, 1, 100);
+            if (_encoderParameters is null || quality != _lastEncoderQuality)
+            {
+                _encoderParameters?.Dispose();
+                _encoderParameters = new EncoderParameters(1);
+                _encoderParameters.Param[0] = new EncoderParameter(Encoder.Quality, quality);
+                _lastEncoderQuality = quality;
+            }
+
+            return _encoderParameters;
+        }
+
+        private void ThrowIfDisposed()
+        {
+            if (_disposed)
+            {
+                throw new ObjectDisposedException(nameof(ScreenCaptureStream));
+            }
+        }
+
+        private static DesktopSurface EnsureSurface(ref DesktopSurface? surface, Size size)
+        {
+            if (surface is null || surface.Size != size)
+            {
+                surface?.Dispose();
+                surface = new DesktopSurface(size);
+            }
+
+            return surface;
+        }
+
+        private static int GetBoxFactor(Size source, Size target)
+        {
+            foreach (var factor in BoxFactors)
+            {
+                if (source.Width == target.Width * factor && source.Height == target.Height * factor)
+                {
+                    return factor;
+                }
+            }
+
+            return 1;
+        }
+
+        private static unsafe void BoxDownsample(DesktopSurface source, DesktopSurface target, int factor)
+        {
+            var shift = factor == 2 ? 2 : 4;
+            var rounding = (1u << (shift - 1)) * 0x00010001u;
+            var sourceWidth = source.Size.Width;
+            var targetWidth = target.Size.Width;
+            var sourcePixels = (uint*)source.Bits;
+            var targetPixels = (uint*)target.Bits;
+
+            for (var y = 0; y < target.Size.Height; y++)
+            {
+                var sourceRow = sourcePixels + (y * factor * sourceWidth);
+                var targetRow = targetPixels + (y * targetWidth);
+                var start = factor == 2 ? HalveRow(sourceRow, sourceRow + sourceWidth, targetRow, targetWidth) : 0;
+                for (var x = start; x < targetWidth; x++)
+                {
+                    var block = sourceRow + (x * factor);
+                    uint blueRed = 0;
+                    uint greenAlpha = 0;
+                    for (var dy = 0; dy < factor; dy++)
+                    {
+                        var row = block + (dy * sourceWidth);
+                        for (var dx = 0; dx < factor; dx++)
+                        {
+                            var pixel = row[dx];
+                            blueRed += pixel & 0x00FF00FFu;
+                            greenAlpha += (pixel >> 8) & 0x00FF00FFu;
+                        }
+                    }
+
+                    targetRow[x] = (((blueRed + rounding) >> shift) & 0x00FF00FFu) |
+                                   ((((greenAlpha + rounding) >> shift) & 0x00FF00FFu) << 8);
+                }
+            }
+        }
+
+        private static unsafe int HalveRow(uint* top, uint* bottom, uint* target, int targetWidth)
+        {
+            if (!Vector128.IsHardwareAccelerated)
+            {
+                return 0;
+            }
+
+            var x = 0;
+            for (; x + 4 <= targetWidth; x += 4)
+            {
+                var source = x * 2;
+                var low = AverageBlocks(Vector128.Load(top + source), Vector128.Load(bottom + source));
+                var high = AverageBlocks(Vector128.Load(top + source + 4), Vector128.Load(bottom + source + 4));
+                Vector128.Narrow(low, high).Store(target + x);
+            }
+
+            return x;
+        }
+
+        private static Vector128<ulong> AverageBlocks(Vector128<uint> top, Vector128<uint> bottom)
+        {
+            var channelMask = Vector128.Create(0x00FF00FFu);
+            var blueRed = ((top & channelMask) + (bottom & channelMask)).AsUInt64();
+            var greenAlpha = ((Vector128.ShiftRightLogical(top, 8) & channelMask) +
+                              (Vector128.ShiftRightLogical(bottom, 8) & channelMask)).AsUInt64();
+            return AveragePairs(blueRed) | Vector128.ShiftLeft(AveragePairs(greenAlpha), 8);
+        }
+
+        private static Vector128<ulong> AveragePairs(Vector128<ulong> sums)
+        {
+            var pairSum = (sums & Vector128.Create(0xFFFFFFFFul)) + Vector128.ShiftRightLogical(sums, 32);
+            return Vector128.ShiftRightLogical(pairSum + Vector128.Create(0x00020002ul), 2) & Vector128.Create(0x00FF00FFul);
+        }
+    }
+
+    private sealed class DesktopSurface : IDisposable
     {
-        var bounds = monitor.Bounds;
-        var targetSize = GetTargetSize(bounds.Size, resolution);
-        using var sourceBitmap = new Bitmap(bounds.Width, bounds.Height, PixelFormat.Format24bppRgb);
-        using (var graphics = Graphics.FromImage(sourceBitmap))
+        private const int SourceCopy = 0x00CC0020;
+        private const int HalftoneStretchMode = 4;
+        private readonly IntPtr _deviceContext;
+        private readonly IntPtr _dibSection;
+        private readonly IntPtr _previousObject;
+
+        public DesktopSurface(Size size)
+        {
+            var header = new BitmapInfoHeader
+            {
+                Size = (uint)Marshal.SizeOf<BitmapInfoHeader>(),
+                Width = size.Width,
+                Height = -size.Height,
+                Planes = 1,
+                BitCount = 32
+            };
+
+            _deviceContext = CreateCompatibleDC(IntPtr.Zero);
+            _dibSection = CreateDIBSection(_deviceContext, ref header, 0, out var bits, IntPtr.Zero, 0);
+            if (_deviceContext == IntPtr.Zero || _dibSection == IntPtr.Zero)
+            {
+                var error = Marshal.GetLastWin32Error();
+                Release();
+                throw new Win32Exception(error);
+            }
+
+            _previousObject = SelectObject(_deviceContext, _dibSection);
+            Bits = bits;
+            SetStretchBltMode(_deviceContext, HalftoneStretchMode);
+            SetBrushOrgEx(_deviceContext, 0, 0, IntPtr.Zero);
+            Size = size;
+            Bitmap = new Bitmap(size.Width, size.Height, size.Width * 4, PixelFormat.Format32bppRgb, bits);
+        }
+
+        public Size Size { get; }
+
+        public IntPtr Bits { get; }
+
+        public unsafe ReadOnlySpan<byte> Pixels => new((void*)Bits, Size.Width * Size.Height * 4);
+
+        public Bitmap Bitmap { get; }
+
+        public void CopyFromScreen(Rectangle source)
         {
-            graphics.CopyFromScreen(bounds.Left, bounds.Top, 0, 0, bounds.Size, CopyPixelOperation.SourceCopy);
-            if (targetSize != bounds.Size)
+            var screenContext = GetDC(IntPtr.Zero);
+            try
+            {
+                var copied = source.Size == Size
+                    ? BitBlt(_deviceContext, 0, 0, Size.Width, Size.Height, screenContext, source.X, source.Y, SourceCopy)
+                    : StretchBlt(_deviceContext, 0, 0, Size.Width, Size.Height, screenContext, source.X, source.Y, source.Width, source.Height, SourceCopy);
+                if (!copied)
+                {
+                    throw new Win32Exception(Marshal.GetLastWin32Error());
+                }
+
+                GdiFlush();
+            }
+            finally
             {
-                using var resized = new Bitmap(targetSize.Width, targetSize.Height, PixelFormat.Format24bppRgb);
-                using var resizedGraphics = Graphics.FromImage(resized);
-                resizedGraphics.InterpolationMode = System.Drawing.Drawing2D.InterpolationMode.HighQualityBicubic;
-                resizedGraphics.DrawImage(sourceBitmap, 0, 0, targetSize.Width, targetSize.Height);
-                return EncodeJpeg(resized, quality);
+                ReleaseDC(IntPtr.Zero, screenContext);
             }
         }
 
-        return EncodeJpeg(sourceBitmap, quality);
+        public void Dispose()
+        {
+            Bitmap.Dispose();
+            Release();
+        }
+
+        private void Release()
+        {
+            if (_deviceContext != IntPtr.Zero)
+            {
+                if (_previousObject != IntPtr.Zero)
+                {
+                    SelectObject(_deviceContext, _previousObject);
+                }
+
+                DeleteDC(_deviceContext);
+            }
+
+            if (_dibSection != IntPtr.Zero)
+            {
+                DeleteObject(_dibSection);
+            }
+        }
     }
 
     private static Size GetTargetSize(Size source, string resolution)
@@ -121,20 +507,15 @@ internal sealed class ScreenCaptureService
             Math.Max(1, (int)Math.Round(source.Height * scale)));
     }
 
-    private static byte[] EncodeJpeg(Bitmap bitmap, int quality)
+    private static void EncodeJpeg(Bitmap bitmap, EncoderParameters parameters, Stream output)
     {
-        using var stream = new MemoryStream();
-        var encoder = ImageCodecInfo.GetImageEncoders().FirstOrDefault(codec => codec.FormatID == ImageFormat.Jpeg.Guid);
-        if (encoder is null)
+        if (JpegEncoder is null)
         {
-            bitmap.Save(stream, ImageFormat.Jpeg);
-            return stream.ToArray();
+            bitmap.Save(output, ImageFormat.Jpeg);
+            return;
         }
 
-        using var parameters = new EncoderParameters(1);
-        parameters.Param[0] = new EncoderParameter(Encoder.Quality, Math.Clamp(quality, 1, 100));
-        bitmap.Save(stream, encoder, parameters);
-        return stream.ToArray();
+        bitmap.Save(output, JpegEncoder, parameters);
     }
 
     [DllImport("user32.dll")]
@@ -143,6 +524,55 @@ internal sealed class ScreenCaptureService
     [DllImport("user32.dll", CharSet = CharSet.Unicode)]
     private static extern bool GetMonitorInfo(IntPtr hMonitor, ref MonitorInfoEx lpmi);
 
+    [DllImport("user32.dll")]
+    private static extern IntPtr GetDC(IntPtr hWnd);
+
+    [DllImport("user32.dll")]
+    private static extern int ReleaseDC(IntPtr hWnd, IntPtr hdc);
+
+    [DllImport("gdi32.dll", SetLastError = true)]
+    private static extern IntPtr CreateCompatibleDC(IntPtr hdc);
+
+    [DllImport("gdi32.dll")]
+    private static extern bool DeleteDC(IntPtr hdc);
+
+    [DllImport("gdi32.dll", SetLastError = true)]
+    private static extern IntPtr CreateDIBSection(IntPtr hdc, ref BitmapInfoHeader pbmi, uint usage, out IntPtr ppvBits, IntPtr hSection, uint offset);
+
+    [DllImport("gdi32.dll")]
+    private static extern IntPtr SelectObject(IntPtr hdc, IntPtr h);
+
+    [DllImport("gdi32.dll")]
+    private static extern bool DeleteObject(IntPtr ho);
+
+    [DllImport("gdi32.dll", SetLastError = true)]
+    private static extern bool BitBlt(IntPtr hdc, int x, int y, int cx, int cy, IntPtr hdcSrc, int x1, int y1, int rop);
+
+    [DllImport("gdi32.dll", SetLastError = true)]
+    private static extern bool StretchBlt(IntPtr hdcDest, int xDest, int yDest, int wDest, int hDest, IntPtr hdcSrc, int xSrc, int ySrc, int wSrc, int hSrc, int rop);
+
+    [DllImport("gdi32.dll")]
+    private static extern int SetStretchBltMode(IntPtr hdc, int mode);
+
+    [DllImport("gdi32.dll")]
+    private static extern bool SetBrushOrgEx(IntPtr hdc, int x, int y, IntPtr lppt);
+
+    [DllImport("gdi32.dll")]
+    private static extern bool GdiFlush();
+
+    [DllImport("winmm.dll")]
+    private static extern uint timeBeginPeriod(uint period);
+
+    [DllImport("winmm.dll")]
+    private static extern uint timeEndPeriod(uint period);
+
+    [DllImport("user32.dll")]
+    private static extern int GetSystemMetrics(int nIndex);
+
+    private readonly record struct MonitorLayout(int Count, Size PrimarySize, Rectangle VirtualScreen);
+
+    private sealed record MonitorSnapshot(IReadOnlyList<ScreenDisplayInfo> Monitors, MonitorLayout Layout, long CheckedAt);
+
     private delegate bool MonitorEnumProc(IntPtr hMonitor, IntPtr hdc, IntPtr lprcMonitor, IntPtr dwData);
 
     [StructLayout(LayoutKind.Sequential, CharSet = CharSet.Unicode)]
@@ -156,6 +586,22 @@ internal sealed class ScreenCaptureService
         public string DeviceName;
     }
 
+    [StructLayout(LayoutKind.Sequential)]
+    private struct BitmapInfoHeader
+    {
+        public uint Size;
+        public int Width;
+        public int Height;
+        public ushort Planes;
+        public ushort BitCount;
+        public uint Compression;
+        public uint SizeImage;
+        public int XPelsPerMeter;
+        public int YPelsPerMeter;
+        public uint ClrUsed;
+        public uint ClrImportant;
+    }
+
     [StructLayout(LayoutKind.Sequential)]
     private struct Rect
     {
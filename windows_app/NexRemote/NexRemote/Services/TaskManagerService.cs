@@ -12,6 +12,7 @@ namespace NexRemote.Services;
 internal sealed class TaskManagerService
 {
     private static readonly TimeSpan SnapshotFreshness = TimeSpan.FromSeconds(1);
+    private static readonly Comparer<ProcessEntry> LowestRankFirst = Comparer<ProcessEntry>.Create((left, right) => CompareRank(right, left));
     private readonly object _sampleGate = new();
     private readonly Dictionary<int, ProcessSample> _processSamples = new();
     private CpuSample? _systemCpuSample;
@@ -20,6 +21,11 @@ internal sealed class TaskManagerService
     private object? _cachedSnapshot;
     private Task? _refreshTask;
 
+    public TaskManagerService()
+    {
+        _ = Task.Run(PrimeCpuSamples);
+    }
+
     public Task<object> HandleRequestAsync(JsonElement data)
     {
         try
@@ -28,7 +34,7 @@ internal sealed class TaskManagerService
             object response = action switch
             {
                 "snapshot" => GetSnapshot(),
-                "list_processes" => ListProcesses(),
+                "list_processes" => ListProcesses(ReadInt32(data, "limit")),
                 "end_process" => EndProcess(ReadInt32(data, "pid")),
                 "system_info" => GetSystemInfo(),
                 _ => new { type = "task_manager", action = "error", message = $"Unknown action: {action}" }
@@ -42,7 +48,7 @@ internal sealed class TaskManagerService
         }
     }
 
-    private object ListProcesses()
+    private object ListProcesses(int limit)
     {
         try
         {
@@ -50,7 +56,7 @@ internal sealed class TaskManagerService
             {
                 type = "task_manager",
                 action = "list_processes",
-                processes = CaptureProcesses()
+                processes = CaptureProcesses(limit)
             };
         }
         catch (Exception ex)
@@ -137,7 +143,7 @@ internal sealed class TaskManagerService
             type = "task_manager",
             action = "snapshot",
             system = CreateSystemInfoPayload(includeEnvelope: false),
-            processes = CaptureProcesses()
+            processes = CaptureProcesses(0)
         };
     }
 
@@ -159,20 +165,31 @@ internal sealed class TaskManagerService
         });
     }
 
-    private List<object> CaptureProcesses()
+    private List<object> CaptureProcesses(int limit)
     {
-        var processes = new List<object>();
+        var entries = limit > 0 ? new PriorityQueue<ProcessEntry, ProcessEntry>(limit + 1, LowestRankFirst) : null;
+        var all = limit > 0 ? null : new List<ProcessEntry>();
         foreach (var process in Process.GetProcesses())
         {
             try
             {
-                processes.Add(new
+                var entry = new ProcessEntry(
+                    process.Id,
+                    SafeProcessName(process),
+                    Math.Round(GetProcessCpuUsage(process), 1),
+                    process.WorkingSet64);
+                if (entries is null)
+                {
+                    all!.Add(entry);
+                }
+                else if (entries.Count < limit)
+                {
+                    entries.Enqueue(entry, entry);
+                }
+                else
                 {
-                    pid = process.Id,
-                    name = SafeProcessName(process),
-                    cpu = Math.Round(GetProcessCpuUsage(process), 1),
-                    memory = process.WorkingSet64
-                });
+                    entries.EnqueueDequeue(entry, entry);
+                }
             }
             catch
             {
@@ -184,12 +201,39 @@ internal sealed class TaskManagerService
             }
         }
 
-        return processes
-            .Cast<dynamic>()
-            .OrderByDescending(item => (double)item.cpu)
-            .ThenBy(item => ((string)item.name).ToLowerInvariant())
-            .Cast<object>()
-            .ToList();
+        if (entries is not null)
+        {
+            all = new List<ProcessEntry>(entries.Count);
+            while (entries.TryDequeue(out var entry, out _))
+            {
+                all.Add(entry);
+            }
+        }
+
+        all!.Sort(CompareRank);
+        return all.ConvertAll(entry => (object)new
+        {
+            pid = entry.Pid,
+            name = entry.Name,
+            cpu = entry.Cpu,
+            memory = entry.Memory
+        });
+    }
+
+    private static int CompareRank(ProcessEntry left, ProcessEntry right)
+    {
+        var byCpu = right.Cpu.CompareTo(left.Cpu);
+        return byCpu != 0 ? byCpu : StringComparer.OrdinalIgnoreCase.Compare(left.Name, right.Name);
+    }
+
+    private void PrimeCpuSamples()
+    {
+        GetCpuUsage();
+        foreach (var process in Process.GetProcesses())
+        {
+            GetProcessCpuUsage(process);
+            process.Dispose();
+        }
     }
 
     private object CreateSystemInfoPayload(bool includeEnvelope = true)
@@ -357,6 +401,8 @@ internal sealed class TaskManagerService
         public uint dwHighDateTime;
     }
 
+    private readonly record struct ProcessEntry(int Pid, string Name, double Cpu, long Memory);
+
     private readonly record struct ProcessSample(TimeSpan TotalProcessorTime, DateTimeOffset Timestamp);
 
     private readonly record struct CpuSample(ulong Idle, ulong Kernel, ulong User);
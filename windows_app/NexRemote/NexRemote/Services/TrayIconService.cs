@@ -1,6 +1,8 @@
 using System;
+using System.Diagnostics;
 using System.IO;
 using System.Runtime.InteropServices;
+using System.Threading;
 
 namespace NexRemote.Services;
 
@@ -22,14 +24,20 @@ public sealed class TrayIconService : ITrayIconService
     private const int ExitCommandId = 1003;
     private const uint CallbackMessage = NativeMethods.WmApp + 1;
 
+    private static readonly TimeSpan BalloonInterval = TimeSpan.FromMilliseconds(1500);
+    private static readonly uint NotifyIconDataSize = (uint)Marshal.SizeOf<NativeMethods.NotifyIconData>();
+
     private readonly NativeMethods.WindowProc _windowProc;
     private readonly object _sync = new();
+    private readonly Timer _balloonTimer;
     private IntPtr _windowHandle;
     private IntPtr _iconHandle;
     private bool _initialized;
     private bool _disposed;
     private bool _serverRunning;
     private string _statusText = "Server stopped";
+    private long _lastBalloonAt;
+    private PendingBalloon? _pendingBalloon;
 
     public event EventHandler? ShowRequested;
     public event EventHandler? ToggleServerRequested;
@@ -38,6 +46,7 @@ public sealed class TrayIconService : ITrayIconService
     public TrayIconService()
     {
         _windowProc = WindowProcedure;
+        _balloonTimer = new Timer(OnBalloonTimerElapsed);
     }
 
     public void Initialize()
@@ -73,8 +82,14 @@ public sealed class TrayIconService : ITrayIconService
     {
         lock (_sync)
         {
+            var text = string.IsNullOrWhiteSpace(statusText) ? "Server stopped" : statusText;
+            if (_initialized && _serverRunning == isRunning && string.Equals(_statusText, text, StringComparison.Ordinal))
+            {
+                return;
+            }
+
             _serverRunning = isRunning;
-            _statusText = string.IsNullOrWhiteSpace(statusText) ? "Server stopped" : statusText;
+            _statusText = text;
             if (!_initialized)
             {
                 return;
@@ -89,16 +104,25 @@ public sealed class TrayIconService : ITrayIconService
     {
         lock (_sync)
         {
-            if (!_initialized)
+            if (_disposed || !_initialized)
             {
                 return;
             }
 
-            var data = CreateNotifyIconData(NativeMethods.NifInfo);
-            data.szInfoTitle = title ?? "NexRemote";
-            data.szInfo = message ?? string.Empty;
-            data.dwInfoFlags = NativeMethods.NiifInfo;
-            NativeMethods.Shell_NotifyIcon(NativeMethods.NimModify, ref data);
+            var balloon = new PendingBalloon(title ?? "NexRemote", message ?? string.Empty);
+            var elapsed = Stopwatch.GetElapsedTime(_lastBalloonAt);
+            if (_lastBalloonAt != 0 && elapsed < BalloonInterval)
+            {
+                if (_pendingBalloon is null)
+                {
+                    _balloonTimer.Change(BalloonInterval - elapsed, Timeout.InfiniteTimeSpan);
+                }
+
+                _pendingBalloon = balloon;
+                return;
+            }
+
+            ShowBalloon(balloon);
         }
     }
 
@@ -106,12 +130,19 @@ public sealed class TrayIconService : ITrayIconService
     {
         lock (_sync)
         {
-            if (!_initialized || _disposed)
+            if (_disposed)
             {
                 return;
             }
 
             _disposed = true;
+            _pendingBalloon = null;
+            _balloonTimer.Dispose();
+            if (!_initialized)
+            {
+                return;
+            }
+
             var data = CreateNotifyIconData(0);
             NativeMethods.Shell_NotifyIcon(NativeMethods.NimDelete, ref data);
 
@@ -131,6 +162,30 @@ public sealed class TrayIconService : ITrayIconService
         }
     }
 
+    private void OnBalloonTimerElapsed(object? state)
+    {
+        lock (_sync)
+        {
+            if (_disposed || !_initialized || _pendingBalloon is not { } balloon)
+            {
+                return;
+            }
+
+            _pendingBalloon = null;
+            ShowBalloon(balloon);
+        }
+    }
+
+    private void ShowBalloon(PendingBalloon balloon)
+    {
+        var data = CreateNotifyIconData(NativeMethods.NifInfo);
+        data.szInfoTitle = balloon.Title;
+        data.szInfo = balloon.Message;
+        data.dwInfoFlags = NativeMethods.NiifInfo;
+        NativeMethods.Shell_NotifyIcon(NativeMethods.NimModify, ref data);
+        _lastBalloonAt = Stopwatch.GetTimestamp();
+    }
+
     private IntPtr WindowProcedure(IntPtr hWnd, uint msg, IntPtr wParam, IntPtr lParam)
     {
         if (msg == CallbackMessage)
@@ -207,7 +262,7 @@ public sealed class TrayIconService : ITrayIconService
     {
         return new NativeMethods.NotifyIconData
         {
-            cbSize = (uint)Marshal.SizeOf<NativeMethods.NotifyIconData>(),
+            cbSize = NotifyIconDataSize,
             hWnd = _windowHandle,
             uID = NativeMethods.TrayIconId,
             uFlags = flags,
@@ -233,4 +288,6 @@ public sealed class TrayIconService : ITrayIconService
 
         return NativeMethods.StockApplicationIcon;
     }
+
+    private sealed record PendingBalloon(string Title, string Message);
 }
@@ -28,6 +28,7 @@ public sealed class TrustedDeviceService : ITrustedDeviceService
     private readonly string _filePath = PathHelper.GetTrustedDevicesPath();
     private readonly SemaphoreSlim _gate = new(1, 1);
     private readonly Dictionary<string, TrustedDeviceRecord> _devices = new(StringComparer.OrdinalIgnoreCase);
+    private string? _persistedJson;
 
     public IReadOnlyDictionary<string, TrustedDeviceRecord> Devices => _devices;
 
@@ -50,9 +51,7 @@ public sealed class TrustedDeviceService : ITrustedDeviceService
             if (!string.IsNullOrWhiteSpace(legacyPath) && File.Exists(legacyPath))
             {
                 await LoadAsync(legacyPath, cancellationToken).ConfigureAwait(false);
-                Directory.CreateDirectory(Path.GetDirectoryName(_filePath)!);
-                var json = JsonSerializer.Serialize(_devices, ProtocolJson.SharedOptions);
-                await File.WriteAllTextAsync(_filePath, json, cancellationToken).ConfigureAwait(false);
+                await WriteAsync(cancellationToken).ConfigureAwait(false);
             }
         }
         finally
@@ -66,9 +65,7 @@ public sealed class TrustedDeviceService : ITrustedDeviceService
         await _gate.WaitAsync(cancellationToken).ConfigureAwait(false);
         try
         {
-            Directory.CreateDirectory(Path.GetDirectoryName(_filePath)!);
-            var json = JsonSerializer.Serialize(_devices, ProtocolJson.SharedOptions);
-            await File.WriteAllTextAsync(_filePath, json, cancellationToken).ConfigureAwait(false);
+            await WriteAsync(cancellationToken).ConfigureAwait(false);
         }
         finally
         {
@@ -123,9 +120,27 @@ public sealed class TrustedDeviceService : ITrustedDeviceService
         }
     }
 
+    private async Task WriteAsync(CancellationToken cancellationToken)
+    {
+        var json = JsonSerializer.Serialize(_devices, ProtocolJson.SharedOptions);
+        if (string.Equals(json, _persistedJson, StringComparison.Ordinal))
+        {
+            return;
+        }
+
+        Directory.CreateDirectory(Path.GetDirectoryName(_filePath)!);
+        await File.WriteAllTextAsync(_filePath, json, cancellationToken).ConfigureAwait(false);
+        _persistedJson = json;
+    }
+
     private async Task LoadAsync(string path, CancellationToken cancellationToken)
     {
         var json = await File.ReadAllTextAsync(path, cancellationToken).ConfigureAwait(false);
+        if (string.Equals(path, _filePath, StringComparison.OrdinalIgnoreCase))
+        {
+            _persistedJson = json;
+        }
+
         if (string.IsNullOrWhiteSpace(json))
         {
             return;
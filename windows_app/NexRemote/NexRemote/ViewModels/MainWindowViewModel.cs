@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.Collections.ObjectModel;
 using System.Text.Json;
 using System.Threading.Tasks;
@@ -20,7 +21,8 @@ public sealed class MainWindowViewModel : ObservableObject
     private readonly ITrustedDeviceService _trustedDeviceService;
     private readonly IGamepadDriverService _gamepadDriverService;
     private readonly IGamepadTransportService _gamepadTransportService;
-    private BitmapImage? _qrCodeImage;
+    private readonly Dictionary<string, ClientConnectionViewModel> _connectedClientIndex = new(StringComparer.OrdinalIgnoreCase);
+    private WriteableBitmap? _qrCodeImage;
     private string _termsOfServiceText = string.Empty;
     private string _termsAndConditionsText = string.Empty;
     private string _privacyPolicyText = string.Empty;
@@ -44,6 +46,7 @@ public sealed class MainWindowViewModel : ObservableObject
     private string _deviceIdPreview = string.Empty;
     private bool _gamepadDriverInstalled;
     private bool _gamepadTransportReady;
+    private bool _legalDocumentsLoaded;
 
     public MainWindowViewModel(
         IAppSettingsService settingsService,
@@ -138,7 +141,7 @@ public sealed class MainWindowViewModel : ObservableObject
         private set => SetProperty(ref _deviceIdPreview, value);
     }
 
-    public BitmapImage? QrCodeImage
+    public WriteableBitmap? QrCodeImage
     {
         get => _qrCodeImage;
         private set
@@ -282,20 +285,26 @@ public sealed class MainWindowViewModel : ObservableObject
             _ => 0
         };
 
-        var termsTask = _legalDocumentService.LoadTermsOfServiceAsync();
-        var conditionsTask = _legalDocumentService.LoadTermsAndConditionsAsync();
-        var privacyTask = _legalDocumentService.LoadPrivacyPolicyAsync();
         var gamepadTask = _gamepadDriverService.IsViGEmBusInstalledAsync();
+        var lanIpTask = _localNetworkService.GetLanIpAddressAsync();
+        if (!_legalDocumentsLoaded)
+        {
+            var termsTask = _legalDocumentService.LoadTermsOfServiceAsync();
+            var conditionsTask = _legalDocumentService.LoadTermsAndConditionsAsync();
+            var privacyTask = _legalDocumentService.LoadPrivacyPolicyAsync();
+
+            await Task.WhenAll(termsTask, conditionsTask, privacyTask);
+            TermsOfServiceText = termsTask.Result;
+            TermsAndConditionsText = conditionsTask.Result;
+            PrivacyPolicyText = privacyTask.Result;
+            _legalDocumentsLoaded = true;
+        }
 
-        await Task.WhenAll(termsTask, conditionsTask, privacyTask, gamepadTask);
-        TermsOfServiceText = termsTask.Result;
-        TermsAndConditionsText = conditionsTask.Result;
-        PrivacyPolicyText = privacyTask.Result;
-        _gamepadDriverInstalled = gamepadTask.Result;
+        _gamepadDriverInstalled = await gamepadTask;
         _gamepadTransportReady = _gamepadDriverInstalled && _gamepadTransportService.IsReady;
         _serverCoordinator.RefreshCapabilities();
 
-        var lanIp = _localNetworkService.GetLanIpAddress();
+        var lanIp = await lanIpTask;
         LanIpText = $"LAN IP: {lanIp}";
         DeviceIdPreview = $"Device ID: {settings.DeviceId}";
         ServerPortsText = $"Ports: {settings.ServerPort} secure / {settings.ServerPortInsecure} fallback / {settings.DiscoveryPort} discovery";
@@ -303,8 +312,11 @@ public sealed class MainWindowViewModel : ObservableObject
 
         var qrPayload = _serverCoordinator.CreateQrPayload(lanIp);
         var qrJson = JsonSerializer.Serialize(qrPayload, ProtocolJson.SharedOptions);
-        QrPayloadPreview = qrJson;
-        QrCodeImage = await _qrCodeService.CreateAsync(qrJson);
+        if (!string.Equals(qrJson, QrPayloadPreview, StringComparison.Ordinal) || QrCodeImage is null)
+        {
+            QrPayloadPreview = qrJson;
+            QrCodeImage = await _qrCodeService.CreateAsync(qrJson);
+        }
 
         RefreshTrustedDevices();
         OnPropertyChanged(nameof(ServerButtonText));
@@ -360,6 +372,7 @@ public sealed class MainWindowViewModel : ObservableObject
         });
 
         await _settingsService.SaveAsync();
+        _localNetworkService.InvalidateLanIpAddress();
         await InitializeAsync();
     }
 
@@ -406,38 +419,31 @@ public sealed class MainWindowViewModel : ObservableObject
 
     public void UpsertConnectedClient(string clientId, string deviceName, string status)
     {
-        for (var index = 0; index < ConnectedClients.Count; index++)
-        {
-            if (string.Equals(ConnectedClients[index].ClientId, clientId, StringComparison.OrdinalIgnoreCase))
-            {
-                ConnectedClients[index] = new ClientConnectionViewModel
-                {
-                    ClientId = clientId,
-                    DisplayName = deviceName,
-                    Summary = $"ID: {clientId}",
-                    Status = status
-                };
-                return;
-            }
-        }
-
-        ConnectedClients.Add(new ClientConnectionViewModel
+        var client = new ClientConnectionViewModel
         {
             ClientId = clientId,
             DisplayName = deviceName,
             Summary = $"ID: {clientId}",
             Status = status
-        });
+        };
+
+        if (_connectedClientIndex.TryGetValue(clientId, out var existing))
+        {
+            ConnectedClients[ConnectedClients.IndexOf(existing)] = client;
+        }
+        else
+        {
+            ConnectedClients.Add(client);
+        }
+
+        _connectedClientIndex[clientId] = client;
     }
 
     public void RemoveConnectedClient(string clientId)
     {
-        for (var index = ConnectedClients.Count - 1; index >= 0; index--)
+        if (_connectedClientIndex.Remove(clientId, out var existing))
         {
-            if (string.Equals(ConnectedClients[index].ClientId, clientId, StringComparison.OrdinalIgnoreCase))
-            {
-                ConnectedClients.RemoveAt(index);
-            }
+            ConnectedClients.Remove(existing);
         }
     }
 